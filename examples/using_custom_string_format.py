@@ -1,9 +1,11 @@
 from opyapi import StringFormat, validate
 import re
 
+COMPILED = re.compile("^my-")
+
 
 def my_format_validator(value: str) -> str:
-    if re.match("^my-", value):
+    if COMPILED.match(value):
         return value
     raise ValueError(f"Could not validate {value}")
 
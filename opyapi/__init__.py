@@ -1,22 +1,98 @@
-from typing import Any, Union
+import pickle
+from functools import lru_cache
+from typing import Any, Callable, Union
 
 from .json_schema import JsonSchema, JsonUri, JsonReference, JsonSchemaStore, URILoader
-from .schema_validator import build_validator_for
-from .string_format import StringFormat
-from copy import deepcopy
+from .schema_validator import build_validator_for as _build_validator_for
+from .string_format import RegexFormat, StringFormat
+from .validators._cache import memoized_validator
+from .validators._regex import use_re2
 
+VALIDATOR_CACHE_SIZE = 1024
 
-def validate(obj: Any, schema: Union[dict, JsonSchema]) -> Any:
+
+class _SchemaKey:
+    """
+    Hashes schema by its identity. Cache entries hold the key, so the schema stays
+    alive and its id cannot be reused for as long as the entry is cached.
+    """
+
+    __slots__ = ("schema",)
+
+    def __init__(self, schema: Any):
+        self.schema = schema
+
+    def __hash__(self) -> int:
+        return id(self.schema)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _SchemaKey) and other.schema is self.schema
+
+
+@lru_cache(maxsize=VALIDATOR_CACHE_SIZE)
+def _cached_schema(key: _SchemaKey, copy: bool) -> JsonSchema:
+    return JsonSchema(pickle.loads(pickle.dumps(key.schema)) if copy else key.schema)
+
+
+@lru_cache(maxsize=VALIDATOR_CACHE_SIZE)
+def _cached_validator(key: _SchemaKey) -> Callable:
+    return _build_validator_for(key.schema)
+
+
+def build_validator_for(schema: Any) -> Callable:
+    """
+    Builds validator for passed schema. Validators are memoized by the identity of the
+    schema object in a least recently used cache of `VALIDATOR_CACHE_SIZE` entries, which
+    keeps both the schema and its validator alive until the entry is evicted, so repeated
+    calls with the same schema skip the compilation walk. A schema must not be mutated once
+    it was passed in, the cached validator would still reflect the old schema; call
+    `build_validator_for.cache_clear()` after mutating it.
+    """
+    return _cached_validator(_SchemaKey(schema))
+
+
+def _clear_validator_cache() -> None:
+    _cached_schema.cache_clear()
+    _cached_validator.cache_clear()
+
+
+build_validator_for.cache_clear = _clear_validator_cache  # type: ignore
+
+
+def validate(obj: Any, schema: Union[dict, JsonSchema], *, copy: bool = True) -> Any:
+    """
+    Validates `obj` against passed schema. Dict schemas are turned into `JsonSchema`
+    once and kept with their validators in least recently used caches of
+    `VALIDATOR_CACHE_SIZE` entries, so mutating a schema after it was passed
+    to `validate` leads to undefined behaviour. Pass `copy=False` when the schema
+    can be consumed in place, which skips copying it altogether.
+    """
     if isinstance(schema, dict):
-        schema = JsonSchema(deepcopy(schema))
+        schema = _cached_schema(_SchemaKey(schema), copy)
     validator = build_validator_for(schema)
     return validator(obj)
 
 
+def is_valid(obj: Any, schema: Union[dict, JsonSchema], *, copy: bool = True) -> bool:
+    """
+    Returns whether `obj` conforms to passed schema instead of raising validation error.
+    """
+    try:
+        validate(obj, schema, copy=copy)
+    except ValueError:
+        return False
+
+    return True
+
+
 __all__ = [
     "validate",
+    "is_valid",
     "StringFormat",
+    "RegexFormat",
     "build_validator_for",
+    "memoized_validator",
+    "use_re2",
     "JsonSchema",
     "JsonUri",
     "JsonReference",
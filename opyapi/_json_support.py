@@ -0,0 +1,28 @@
+import re
+from json import load as load_json, loads as loads_json
+from typing import IO, Any, Union
+
+try:
+    from orjson import JSONDecodeError as _OrjsonDecodeError, loads as _loads_json
+except ImportError:  # orjson is optional, fall back to the standard library parser
+    pass
+else:
+    # orjson parses integers outside of the 64 bit range as floats, such integers have at least
+    # 19 digits, documents which may contain them are parsed with the standard library instead
+    _LONG_NUMBER = re.compile("[0-9]{19}")
+    _LONG_NUMBER_BYTES = re.compile(b"[0-9]{19}")
+    _loads_stdlib_json = loads_json
+
+    def loads_json(data: Union[bytes, str]) -> Any:  # type: ignore
+        pattern = _LONG_NUMBER_BYTES if isinstance(data, bytes) else _LONG_NUMBER
+        if pattern.search(data):  # type: ignore
+            return _loads_stdlib_json(data)
+
+        # orjson rejects literals the standard library accepts, e.g. `NaN`, `Infinity`, `1e400` or lone surrogates
+        try:
+            return _loads_json(data)
+        except _OrjsonDecodeError:
+            return _loads_stdlib_json(data)
+
+    def load_json(file: IO) -> Any:  # type: ignore
+        return loads_json(file.read())
@@ -1,4 +1,9 @@
-from yaml import FullLoader as YamlFullLoader, load as load_yaml
+from yaml import load as load_yaml
 from functools import partial
 
-load_yaml = partial(load_yaml, Loader=YamlFullLoader)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # libyaml bindings are not available
+    from yaml import SafeLoader as YamlLoader  # type: ignore
+
+load_yaml = partial(load_yaml, Loader=YamlLoader)
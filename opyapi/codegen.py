@@ -0,0 +1,357 @@
+import re
+from functools import lru_cache
+from numbers import Number
+from operator import itemgetter
+from types import CodeType
+from typing import Any, Callable, Dict, List
+
+from opyapi.errors import (
+    AdditionalPropertiesValidationError,
+    EnumValidationError,
+    ExclusiveMaximumValidationError,
+    ExclusiveMinimumValidationError,
+    FormatValidationError,
+    MaximumItemsValidationError,
+    MaximumPropertiesValidationError,
+    MaximumValidationError,
+    MinimumItemsValidationError,
+    MinimumPropertiesValidationError,
+    MinimumValidationError,
+    PropertyNameValidationError,
+    RequiredPropertyValidationError,
+    TypeValidationError,
+    UniqueItemsValidationError,
+)
+from opyapi.json_schema import JsonSchema
+from opyapi.schema_validator import build_validator_for
+from opyapi.string_format import StringFormat
+from opyapi.validators import enum_members
+from opyapi.validators._regex import compile_pattern
+from opyapi.validators.array_validators import has_duplicates
+from opyapi.validators.number_validators import validate_multiple_of
+from opyapi.validators.object_validators import validate_property
+
+ANNOTATION_PROPERTIES = {
+    "title",
+    "description",
+    "default",
+    "examples",
+    "$comment",
+    "readOnly",
+    "writeOnly",
+    "deprecated",
+}
+
+TYPE_PROPERTIES = {
+    "string": {"type", "minLength", "maxLength", "pattern", "format"},
+    "integer": {"type", "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "multipleOf"},
+    "number": {"type", "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "multipleOf"},
+    "boolean": {"type"},
+    "null": {"type"},
+    "object": {"type", "properties", "required", "additionalProperties", "minProperties", "maxProperties"},
+    "array": {"type", "items", "minItems", "maxItems", "uniqueItems"},
+}
+
+_GLOBALS = {
+    "re": re,
+    "Number": Number,
+    "StringFormat": StringFormat,
+    "has_duplicates": has_duplicates,
+    "validate_multiple_of": validate_multiple_of,
+    "validate_property": validate_property,
+    "AdditionalPropertiesValidationError": AdditionalPropertiesValidationError,
+    "EnumValidationError": EnumValidationError,
+    "ExclusiveMaximumValidationError": ExclusiveMaximumValidationError,
+    "ExclusiveMinimumValidationError": ExclusiveMinimumValidationError,
+    "FormatValidationError": FormatValidationError,
+    "MaximumItemsValidationError": MaximumItemsValidationError,
+    "MaximumPropertiesValidationError": MaximumPropertiesValidationError,
+    "MaximumValidationError": MaximumValidationError,
+    "MinimumItemsValidationError": MinimumItemsValidationError,
+    "MinimumPropertiesValidationError": MinimumPropertiesValidationError,
+    "MinimumValidationError": MinimumValidationError,
+    "PropertyNameValidationError": PropertyNameValidationError,
+    "RequiredPropertyValidationError": RequiredPropertyValidationError,
+    "TypeValidationError": TypeValidationError,
+    "UniqueItemsValidationError": UniqueItemsValidationError,
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_source(source: str) -> CodeType:
+    # compiling dominates build time, generated sources repeat for structurally equal schemas
+    return compile(source, "<opyapi:schema>", "exec")
+
+
+class _CodeGenerator:
+    """
+    Emits python source with one specialized function per schema node. Nodes using
+    keywords the generator does not specialize are delegated to `build_validator_for`.
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = dict(_GLOBALS)
+        self._counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}_{self._counter}"
+
+    def _constant(self, prefix: str, value: Any) -> str:
+        name = self._name(prefix)
+        self.namespace[name] = value
+        return name
+
+    def _emit(self, name: str, body: List[str]) -> str:
+        self.lines.append(f"def {name}(value):")
+        self.lines.extend("    " + line for line in body)
+        self.lines.append("")
+        return name
+
+    def compile_node(self, schema: Any) -> str:
+        if isinstance(schema, dict) and schema:
+            if "enum" in schema:
+                enum = enum_members(schema["enum"])
+                if enum is not None:
+                    return self._compile_enum(schema["enum"], enum)
+            elif _is_supported(schema):
+                return getattr(self, f"_compile_{schema['type']}")(schema)
+
+        return self._constant("_validator", build_validator_for(schema))
+
+    def _compile_enum(self, values: Any, enum: frozenset) -> str:
+        enum_name = self._constant("_ENUM", enum)
+        values_name = self._constant("_ENUM_VALUES", values)
+
+        return self._emit(
+            self._name("_validate_enum"),
+            [
+                "try:",
+                f"    if (type(value) is bool, value) in {enum_name}:",
+                "        return value",
+                "except TypeError:",
+                "    pass",
+                f"raise EnumValidationError(expected_values={values_name})",
+            ],
+        )
+
+    def _compile_string(self, schema: Dict[str, Any]) -> str:
+        body = [
+            "if not isinstance(value, str):",
+            "    raise TypeValidationError(value=value, expected_type=str, actual_type=type(value))",
+        ]
+        if "minLength" in schema:
+            minimum = self._constant("_MIN_LENGTH", schema["minLength"])
+            body += [
+                f"if len(value) < {minimum}:",
+                f"    raise MinimumItemsValidationError(expected_minimum={minimum})",
+            ]
+        if "maxLength" in schema:
+            maximum = self._constant("_MAX_LENGTH", schema["maxLength"])
+            body += [
+                f"if len(value) > {maximum}:",
+                f"    raise MaximumItemsValidationError(expected_maximum={maximum})",
+            ]
+        if "pattern" in schema:
+            pattern = self._constant("_PATTERN", compile_pattern(schema["pattern"]))
+            body += [
+                f"if not {pattern}.search(value):",
+                f"    raise FormatValidationError(expected_format={pattern}.pattern)",
+            ]
+        if "format" in schema:
+            format_name = self._constant("_FORMAT", schema["format"])
+            body += [
+                f"format_pattern = StringFormat.regex_formats.get({format_name})",
+                "if format_pattern is None:",
+                f"    return StringFormat[{format_name}](value)",
+                "if not format_pattern.match(value):",
+                f"    raise FormatValidationError(expected_format={format_name})",
+                "return value",
+            ]
+        else:
+            body.append("return value")
+
+        return self._emit(self._name("_validate_string"), body)
+
+    def _compile_number(self, schema: Dict[str, Any], integer: bool = False) -> str:
+        expected_type = "int" if integer else "Number"
+        body = [
+            "if value is True or value is False:",
+            f"    raise TypeValidationError(expected_type={expected_type}, actual_type=type(value))",
+            f"if not isinstance(value, {expected_type}):",
+            f"    raise TypeValidationError(expected_type={expected_type}, actual_type=type(value))",
+        ]
+        checks = [
+            ("minimum", ">=", "MinimumValidationError", "expected_minimum"),
+            ("maximum", "<=", "MaximumValidationError", "expected_maximum"),
+            ("exclusiveMaximum", "<", "ExclusiveMaximumValidationError", "expected_maximum"),
+            ("exclusiveMinimum", ">", "ExclusiveMinimumValidationError", "expected_minimum"),
+        ]
+        for keyword, operator, error, argument in checks:
+            if keyword in schema:
+                limit = self._constant("_LIMIT", schema[keyword])
+                body += [
+                    f"if not value {operator} {limit}:",
+                    f"    raise {error}({argument}={limit})",
+                ]
+        if "multipleOf" in schema:
+            body.append(f"validate_multiple_of(value, {self._constant('_MULTIPLE_OF', schema['multipleOf'])})")
+        body.append("return value")
+
+        return self._emit(self._name("_validate_number"), body)
+
+    def _compile_integer(self, schema: Dict[str, Any]) -> str:
+        return self._compile_number(schema, integer=True)
+
+    def _compile_boolean(self, schema: Dict[str, Any]) -> str:
+        return self._emit(
+            self._name("_validate_boolean"),
+            [
+                "if value is True or value is False:",
+                "    return value",
+                "raise TypeValidationError(expected_type=bool, actual_type=type(value))",
+            ],
+        )
+
+    def _compile_null(self, schema: Dict[str, Any]) -> str:
+        return self._emit(
+            self._name("_validate_null"),
+            [
+                "if value is None:",
+                "    return None",
+                "raise TypeValidationError(expected_type=type(None), actual_type=type(value))",
+            ],
+        )
+
+    def _compile_object(self, schema: Dict[str, Any]) -> str:
+        property_validators = {key: self.compile_node(value) for key, value in schema.get("properties", {}).items()}
+        properties = self._name("_PROPERTIES")
+        self.lines.append(
+            f"{properties} = {{" + ", ".join(f"{key!r}: {name}" for key, name in property_validators.items()) + "}"
+        )
+        self.lines.append("")
+        additional_properties = schema.get("additionalProperties", True)
+        body = [
+            "if not isinstance(value, dict):",
+            '    raise TypeValidationError(expected_type="object", actual_type=type(value))',
+        ]
+        if "minProperties" in schema:
+            minimum = self._constant("_MIN_PROPERTIES", int(schema["minProperties"]))
+            body += [
+                f"if len(value) < {minimum}:",
+                f"    raise MinimumPropertiesValidationError(expected_minimum={minimum})",
+            ]
+        if "maxProperties" in schema:
+            maximum = self._constant("_MAX_PROPERTIES", int(schema["maxProperties"]))
+            body += [
+                f"if len(value) > {maximum}:",
+                f"    raise MaximumPropertiesValidationError(expected_maximum={maximum})",
+            ]
+        if schema.get("required"):
+            required = self._constant("_REQUIRED", tuple(schema["required"]))
+            get_required = self._constant("_GET_REQUIRED", itemgetter(*schema["required"]))
+            body += [
+                "try:",
+                f"    {get_required}(value)",
+                "except KeyError:",
+                f"    for key in {required}:",
+                "        if key not in value:",
+                "            raise RequiredPropertyValidationError(property_name=key)",
+            ]
+        body += [
+            "result = {}",
+            "for key, item in value.items():",
+            "    if not isinstance(key, str):",
+            "        raise PropertyNameValidationError(",
+            '            sub_code="type_error",',
+            "            property_name=key,",
+            '            validation_error=f"Expected string type, got {type(key)}",',
+            "        )",
+            f"    validator = {properties}.get(key)",
+            "    if validator is not None:",
+            "        result[key] = validate_property(key, item, validator)",
+        ]
+        if additional_properties is False:
+            body += [
+                "    else:",
+                "        raise AdditionalPropertiesValidationError(property_name=key)",
+            ]
+        elif additional_properties is True:
+            body += [
+                "    else:",
+                "        result[key] = item",
+            ]
+        else:
+            additional = self.compile_node(additional_properties)
+            body += [
+                "    else:",
+                f"        result[key] = validate_property(key, item, {additional})",
+            ]
+        body.append("return result")
+
+        return self._emit(self._name("_validate_object"), body)
+
+    def _compile_array(self, schema: Dict[str, Any]) -> str:
+        body = [
+            "if not isinstance(value, list):",
+            '    raise TypeValidationError(expected_type="array", actual_type=type(value))',
+        ]
+        if "items" in schema:
+            body.append(f"result = [{self.compile_node(schema['items'])}(item) for item in value]")
+        else:
+            body.append("result = value")
+        if schema.get("uniqueItems"):
+            body += [
+                "if has_duplicates(value):",
+                "    raise UniqueItemsValidationError()",
+            ]
+        if "minItems" in schema:
+            minimum = self._constant("_MIN_ITEMS", schema["minItems"])
+            body += [
+                f"if len(result) < {minimum}:",
+                f"    raise MinimumItemsValidationError(expected_minimum={minimum})",
+            ]
+        if "maxItems" in schema:
+            maximum = self._constant("_MAX_ITEMS", schema["maxItems"])
+            body += [
+                f"if len(result) > {maximum}:",
+                f"    raise MaximumItemsValidationError(expected_maximum={maximum})",
+            ]
+        body.append("return result")
+
+        return self._emit(self._name("_validate_array"), body)
+
+    def build(self, schema: Any) -> Callable:
+        name = self.compile_node(schema)
+        exec(_compile_source("\n".join(self.lines)), self.namespace)
+
+        return self.namespace[name]
+
+
+def _is_supported(schema: Dict[str, Any]) -> bool:
+    schema_type = schema.get("type")
+    if not isinstance(schema_type, str) or schema_type not in TYPE_PROPERTIES:
+        return False
+    if schema_type == "null" and "default" in schema:
+        return False
+    if schema_type == "array" and not isinstance(schema.get("items", {}), dict):
+        return False
+
+    return schema.keys() <= TYPE_PROPERTIES[schema_type] | ANNOTATION_PROPERTIES
+
+
+def compile_schema(schema: Any) -> Callable:
+    """
+    Compiles schema into a python function specialized for keywords used by the schema.
+    Every call returns a new function, compiled code of recently generated sources is reused.
+    """
+    if isinstance(schema, JsonSchema):
+        schema = schema.document
+
+    return _CodeGenerator().build(schema)
+
+
+__all__ = [
+    "compile_schema",
+]
@@ -4,25 +4,52 @@ from typing import Any
 class ValidationError(ValueError):
     code: str = "validation_error"
     message: str
+    _formatted_code: bool = False
+    _formatted_message: bool = True
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._formatted_code = "{" in cls.code
+        cls._formatted_message = "{" in getattr(cls, "message", "{}")
 
     def __init__(self, *args, **kwargs: Any):
         if "code" in kwargs:
             self.code = kwargs["code"]
+            if "{" in self.code:
+                self.code = self.code.format(**kwargs)
+        elif self._formatted_code:
+            self.code = self.code.format(**kwargs)
 
         self.context = kwargs
-        self.code = self.code.format(**self.context)
         if args:
             self.message = str(args[0])
-            super().__init__(*args)
-        else:
-            super().__init__(str(self))
+        super().__init__(*args)
+
+    @property  # type: ignore
+    def args(self) -> tuple:
+        # message is formatted only when error's arguments are accessed
+        args = BaseException.args.__get__(self)  # type: ignore
+        if args:
+            return args
+
+        return (str(self),)
+
+    @args.setter
+    def args(self, value: tuple) -> None:
+        BaseException.args.__set__(self, value)  # type: ignore
 
     def __bool__(self) -> bool:
         return False
 
     def __str__(self) -> str:
+        if not self._formatted_message and "message" not in self.__dict__:
+            return self.message
+
         return self.message.format(**self.context)
 
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
 
 class TypeValidationError(ValidationError, TypeError):
     code = "type_error"
@@ -161,3 +188,8 @@ class DependencyValidationError(ObjectValidationError):
 class ContainsValidationError(ValidationError):
     code = "contains_error"
     message = "Failed to assert that `{value}` contains expected schema. {error}"
+
+
+class AnyOfValidationError(ValidationError):
+    code = "any_error"
+    message = "Value could not be validated: {value}"
@@ -1,11 +1,19 @@
-import re
+import sys
 from abc import abstractmethod
+from collections import ChainMap
+from collections.abc import Mapping
 from functools import cached_property, lru_cache
-from json import load as load_json
-from os import path
-from typing import Any, Dict, Optional, Union, List, Set, ItemsView, KeysView, ValuesView
+from hashlib import blake2b
+from io import BytesIO
+from json import dumps as dump_json
+from os import environ, getpid, makedirs, path, replace
+from typing import Any, Dict, Optional, Union, List, Set, Tuple, ItemsView, Iterator, KeysView, ValuesView
+from typing import MutableMapping, cast
 from typing import Protocol
+from weakref import WeakValueDictionary
 
+from .__version__ import __version__
+from ._json_support import load_json, loads_json
 from ._yaml_support import load_yaml
 
 FILE_LOADERS = {
@@ -13,52 +21,83 @@ FILE_LOADERS = {
     "yml": load_yaml,
     "json": load_json,
 }
-JSON_URI_REGEX = r"(?P<protocol>[a-z\.\-]+)\:\/\/(?P<path>[^#]+)(\#(?P<fragment>[^#]+))?"
-JSON_URI_PARTIAL_REGEX = r"((?P<protocol>[a-z\.\-]+)\:\/\/)?(?P<path>[^#]+)?(\#(?P<fragment>[^#]+))?"
+_MISSING = object()
+_PROTOCOL_CHARACTERS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.-")
+
+
+def _split_uri(uri: str) -> Tuple[Optional[str], str, Optional[str]]:
+    """
+    Splits uri into protocol, path and fragment, missing parts are returned as `None`
+    except for the path which is returned as an empty string.
+    """
+    protocol: Optional[str]
+    protocol, separator, rest = uri.partition("://")
+    if not separator or not protocol or not _PROTOCOL_CHARACTERS.issuperset(protocol):
+        protocol, rest = None, uri
+    uri_path, _, fragment = rest.partition("#")
+
+    return protocol, uri_path, fragment.partition("#")[0] or None
+
+
+@lru_cache(maxsize=4096)
+def _parse_uri(uri: str) -> Tuple[str, str, Optional[str]]:
+    protocol, uri_path, fragment = _split_uri(uri)
+    if protocol is None or not uri_path:
+        raise ValueError(f"passed string `{uri}` is not a valid URI identifier")
+
+    return protocol, uri_path, fragment
 
 
 class JsonUri:
+    __slots__ = ("protocol", "path", "_fragment", "source", "fragment", "_str", "_directory")
+    protocol: str
+    path: str
+    _fragment: Optional[str]
+    source: str
+    fragment: str
+    _str: str
+    _directory: Tuple[str, ...]
+
     def __init__(self, uri: str):
-        matched = re.match(JSON_URI_REGEX, uri, re.IGNORECASE)
-        if not matched:
-            raise ValueError(f"passed string `{uri}` is not a valid URI identifier")
+        self._set(*_parse_uri(uri))
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def from_str(cls, uri: str) -> "JsonUri":
+        """
+        Returns shared instance for passed uri string, uris are not
+        modified once created so instances can be reused safely.
+        """
+        return cls(uri)
 
-        self.protocol = matched.group("protocol")
-        self.path = matched.group("path")
-        self._fragment = matched.group("fragment")
+    @classmethod
+    def _create(cls, protocol: str, uri_path: str, fragment: Optional[str]) -> "JsonUri":
+        uri = cls.__new__(cls)
+        uri._set(protocol, uri_path, fragment)
+        return uri
 
-    def __add__(self, other: str) -> "JsonUri":
-        result = JsonUri.__new__(JsonUri)
-        result.protocol = self.protocol
-        result.path = self.path
-        result._fragment = self._fragment
+    def _set(self, protocol: str, uri_path: str, fragment: Optional[str]) -> None:
+        self.protocol = protocol
+        self.path = uri_path
+        self._fragment = fragment
+        # source is used as a key by stores, interning it makes lookups compare by identity
+        self.source = sys.intern(f"{protocol}://{uri_path}")
+        self.fragment = f"#{fragment}" if fragment else ""
+        self._str = self.source + self.fragment
 
+    def __add__(self, other: str) -> "JsonUri":
         if other.startswith("#"):
-            result._fragment = other[1:]  # skip `#`
-            return result
+            return JsonUri._create(self.protocol, self.path, other[1:])  # skip `#`
 
-        matched = re.match(JSON_URI_PARTIAL_REGEX, other, re.IGNORECASE)
-        result._fragment = matched.group("fragment")  # type: ignore
+        protocol, new_path, fragment = _split_uri(other)
 
-        if matched.group("protocol"):  # type: ignore
-            result.protocol = matched.group("protocol")  # type: ignore
-            result.path = matched.group("path")  # type: ignore
-            return result
+        if protocol:
+            return JsonUri._create(protocol, new_path, fragment)
 
-        new_path = matched.group("path")  # type: ignore
         if new_path.startswith("/"):
-            result.path = matched.group("path")  # type: ignore
-            result._fragment = matched.group("fragment")  # type: ignore
-
-            return result
-
-        path_items = self.path.split("/")
-        last_item = path_items[-1]
-        is_file = last_item[-4] == "." or last_item[-5] == "."
-
-        if is_file:
-            path_items.pop()
+            return JsonUri._create(self.protocol, new_path, fragment)
 
+        path_items = list(self._directory_items())
         for item in new_path.split("/"):
             if item == "..":
                 path_items.pop()
@@ -67,34 +106,28 @@ class JsonUri:
                 continue
             path_items.append(item)
 
-        result.path = "/".join(path_items)
-        return result
-
-    def __str__(self) -> str:
-        if self._fragment:
-            return f"{self.source}#{self._fragment}"
+        return JsonUri._create(self.protocol, "/".join(path_items), fragment)
 
-        return self.source
+    def _directory_items(self) -> Tuple[str, ...]:
+        # relative uris are joined many times against the same base, so its split path is kept
+        try:
+            return self._directory
+        except AttributeError:
+            path_items = self.path.split("/")
+            if "." in path_items[-1]:  # relative to the directory of a file
+                path_items.pop()
+            self._directory = tuple(path_items)
 
-    def __repr__(self) -> str:
-        return f"JsonUri({self.__str__()})"
+        return self._directory
 
-    @cached_property
-    def source(self) -> str:
-        return f"{self.protocol}://{self.path}"
+    def __str__(self) -> str:
+        return self._str
 
-    @cached_property
-    def fragment(self) -> str:
-        if self._fragment:
-            return f"#{self._fragment}"
-        return ""
+    def __repr__(self) -> str:
+        return f"JsonUri({self._str})"
 
     def base_uri(self) -> "JsonUri":
-        uri = JsonUri.__new__(JsonUri)
-        uri.protocol = self.protocol
-        uri.path = self.path
-        uri._fragment = ""
-        return uri
+        return JsonUri._create(self.protocol, self.path, None)
 
 
 class URILoader(Protocol):
@@ -109,10 +142,22 @@ class URILoader(Protocol):
 
 
 class FileLoader(URILoader):
+    """
+    Loads schemas from local files. When `cache` is enabled parsed documents are also
+    stored as json files in `cache_dir` (`$XDG_CACHE_HOME/opyapi` by default), keyed by
+    a hash of the file contents and library version, and reused until the file changes.
+    Documents without an exact json representation (e.g. yaml dates) are not cached.
+    """
+
     LOADERS = FILE_LOADERS
+    CACHE_FORMAT = "1"
 
-    def __init__(self):
-        self.store = {}
+    def __init__(self, cache: bool = False, cache_dir: Optional[str] = None):
+        self.store: Dict[str, Dict[str, Any]] = {}
+        self.cache = cache
+        self.cache_dir = cache_dir or path.join(
+            environ.get("XDG_CACHE_HOME") or path.join(path.expanduser("~"), ".cache"), "opyapi"
+        )
 
     def load(self, uri: JsonUri) -> Dict[str, Any]:
         if uri.source not in self.store:
@@ -124,22 +169,69 @@ class FileLoader(URILoader):
         if uri.protocol != "file":
             raise ValueError(f"unsupported protocol `{uri.protocol}`, expected `file` protocol.")
 
-        file = open(uri.path, mode="r")
-        extension = file.name.split(".")[-1]
+        extension = uri.path.split(".")[-1]
         if extension not in self.LOADERS:
-            raise TypeError(f"could not load resource from uri `{file.name}`, unsupported file type")
-
-        self.store[uri.source] = self.LOADERS[extension](file)  # type: ignore
+            raise TypeError(f"could not load resource from uri `{uri.path}`, unsupported file type")
+
+        # loaders accept binary streams, which skips the text decoding layer
+        with open(uri.path, mode="rb") as file:
+            if self.cache:
+                document = self._load_cached(file.read(), extension)
+            else:
+                document = self.LOADERS[extension](file)  # type: ignore
+
+        self.store[uri.source] = document
+
+    def _load_cached(self, content: bytes, extension: str) -> Dict[str, Any]:
+        key = blake2b(content, digest_size=16)
+        key.update(f"{extension}:{__version__}:{self.CACHE_FORMAT}".encode())
+        cache_file = path.join(self.cache_dir, key.hexdigest() + ".json")
+        try:
+            with open(cache_file, mode="rb") as cache:
+                return loads_json(cache.read())
+        except (OSError, ValueError):
+            pass
+
+        document = self.LOADERS[extension](BytesIO(content))  # type: ignore
+        try:
+            encoded = dump_json(document)
+            if loads_json(encoded) != document:  # yaml values without exact json form, e.g. non string keys
+                return document
+            makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            temporary_file = f"{cache_file}.{getpid()}.tmp"
+            with open(temporary_file, mode="w") as cache:
+                cache.write(encoded)
+            replace(temporary_file, cache_file)
+        except (OSError, TypeError, ValueError):  # cache is best effort, read-only locations are skipped
+            pass
+
+        return document
 
 
 class JsonReference:
-    def __init__(self, owner: "JsonSchema", uri: JsonUri, ref_document: Dict[str, Any] = None):
+    _shared: "WeakValueDictionary[Tuple[int, str], JsonReference]" = WeakValueDictionary()
+
+    def __init__(self, owner: "JsonSchema", uri: JsonUri, ref_document: Optional[Dict[str, Any]] = None):
         self._uri = uri
         self.owner = owner
         self._document: Optional[Any] = None
         self._ready = False
         self._ref_document = ref_document if ref_document is not None else {}
 
+    @classmethod
+    def shared(cls, owner: "JsonSchema", uri: JsonUri) -> "JsonReference":
+        """
+        Returns reference without sibling keywords, references to the same uri
+        within the same schema are shared so their documents are resolved once.
+        """
+        key = (id(owner), str(uri))
+        reference = cls._shared.get(key)
+        if reference is None:
+            reference = cls(owner, uri)
+            cls._shared[key] = reference
+
+        return reference
+
     def __contains__(self, item) -> bool:
         return item in self.document
 
@@ -153,21 +245,40 @@ class JsonReference:
         return self[key]
 
     @cached_property
-    def document(self) -> Union[List, Dict]:
-        if self.uri.source == self.owner.id.source:
-            doc_fragment = self.owner.query(self.uri.fragment)
-        else:
-            doc_fragment = JsonSchemaStore.get(self.uri).query(self.uri.fragment)
-
-        if isinstance(doc_fragment, JsonReference):
-            doc_fragment = doc_fragment.document
-        if isinstance(doc_fragment, dict):
-            self._document = {**self._ref_document, **doc_fragment}
-        else:
-            self._document = doc_fragment
+    def document(self) -> Union[List, Mapping]:
+        # follow chains of references iteratively, then layer sibling keywords back to front,
+        # referenced documents take precedence over sibling keywords and are not copied
+        chain = [self]
+        visited = {id(self)}
+        doc_fragment = self._resolve()
+        while isinstance(doc_fragment, JsonReference):
+            if "document" in doc_fragment.__dict__:  # already resolved
+                doc_fragment = doc_fragment.document
+                break
+            if id(doc_fragment) in visited:
+                raise RecursionError(f"could not resolve cycling reference {doc_fragment.uri}")
+            visited.add(id(doc_fragment))
+            chain.append(doc_fragment)
+            doc_fragment = doc_fragment._resolve()
+
+        for reference in reversed(chain):
+            if not reference._ref_document or not isinstance(doc_fragment, Mapping):
+                continue
+            if isinstance(doc_fragment, ChainMap):
+                doc_fragment = ChainMap(*doc_fragment.maps, reference._ref_document)
+            else:
+                # layered documents are only read, so read-only mappings are accepted as the first one too
+                doc_fragment = ChainMap(cast(MutableMapping[str, Any], doc_fragment), reference._ref_document)
+        self._document = doc_fragment
 
         return self._document
 
+    def _resolve(self) -> Any:
+        if self.uri.source == self.owner.id.source:
+            return self.owner.query(self.uri.fragment)
+
+        return JsonSchemaStore.get(self.uri).query(self.uri.fragment)
+
     def items(self) -> ItemsView:
         return self.document.items()  # type: ignore
 
@@ -180,8 +291,8 @@ class JsonReference:
     def __repr__(self) -> str:
         return f"JsonReference({str(self.uri)})"
 
-    def __iter__(self):
-        return iter({})
+    def __iter__(self) -> Iterator:
+        return iter(self.document)
 
     @property
     def uri(self) -> JsonUri:
@@ -189,7 +300,9 @@ class JsonReference:
 
 
 class JsonSchema:
-    def __init__(self, document: Any, id_: JsonUri = None):
+    def __init__(self, document: Any, id_: Optional[JsonUri] = None):
+        # schemas without an uri are only referenced by their own documents, so they are not kept in the store
+        self._local = id_ is None
         if id_ is None:
             id_ = JsonUri("self://schema:local@" + str(id(document)))
 
@@ -198,20 +311,24 @@ class JsonSchema:
 
         self._id = id_
         self._document = document
+        self._query_cache: Dict[str, Any] = {}
         if self._document is True or self._document is False:
             self._ready = True
             return
 
         self._ready = False
-        self._current_path: List[Union[str, int]] = []
-        self.anchors: Dict[str, str] = {}
+        self.anchors: Dict[str, Tuple[str, ...]] = {}
 
     @classmethod
     def from_file(cls, file_name: str) -> "JsonSchema":
+        uri = JsonUri.from_str(f"file://{file_name}")
+        schema = JsonSchemaStore.store.get(uri.source)
+        if schema is not None:  # skip the stat call for already loaded files
+            return schema
         if not path.isfile(file_name):
             raise ValueError(f"Passed file name `{file_name}` is not a valid file.")
 
-        return JsonSchemaStore.get(JsonUri(f"file://{file_name}"))
+        return JsonSchemaStore.get(uri)
 
     @property
     def id(self) -> JsonUri:
@@ -226,65 +343,66 @@ class JsonSchema:
         document = self._document
 
         if "$id" in document:
-            self._id = JsonUri(document["$id"])
+            self._id = JsonUri.from_str(document["$id"])
             if self._id.fragment:
                 raise ValueError("$id property of schema cannot contain reference to a fragment document.")
             del document["$id"]
+            self._local = False
 
-        if not JsonSchemaStore.has(self._id):
+        if not self._local and not JsonSchemaStore.has(self._id):
             JsonSchemaStore.add(self._id, self)
 
-        self._document = {key: self._process_node(value, key) for key, value in document.items()}
-        self._ready = True
+        self._process_nodes(document)
 
-    def _process_node(self, node: Any, key: Union[str, int]) -> Any:
-        self._current_path.append(key)
+        self._document = document
+        self._ready = True
 
+    def _process_nodes(self, document: Dict[str, Any]) -> None:
+        # depth first walk over the document using an explicit stack of child iterators,
+        # nodes are processed in place and shared sub-documents (e.g. yaml aliases) only once
+        _intern_keys(document)
+        processed_nodes: Dict[int, Any] = {id(document): document}
+        stack: List[Tuple[Any, Iterator, Optional[tuple]]] = [(document, iter(document.items()), None)]
+        # hot loop, bind lookups to locals once
+        get_processed = processed_nodes.get
+        push = stack.append
+        process_node = self._process_node
+        while stack:
+            parent, children, parent_path = stack[-1]
+            for key, node in children:
+                if not isinstance(node, (list, dict)):
+                    continue
+                node_id = id(node)
+                processed = get_processed(node_id)
+                if processed is not None:
+                    parent[key] = processed
+                    continue
+
+                node_path = (parent_path, key)
+                parent[key] = processed_nodes[node_id] = process_node(node, node_path)
+                push((node, enumerate(node) if isinstance(node, list) else iter(node.items()), node_path))
+                break
+            else:
+                stack.pop()
+
+    def _process_node(self, node: Union[list, dict], node_path: tuple) -> Any:
         if isinstance(node, list):
-            result = [self._process_node(value, key) for key, value in enumerate(node)]
-            self._current_path.pop()
-            return result
-
-        elif isinstance(node, dict):
-            if "$dynamicAnchor" in node:
-                self.anchors[f"#{node['$dynamicAnchor']}"] = "#/" + "/".join([str(i) for i in self._current_path])
-                del node["$dynamicAnchor"]
-
-            if "$anchor" in node:
-                self.anchors[f"#{node['$anchor']}"] = "#/" + "/".join([str(i) for i in self._current_path])
-                del node["$anchor"]
-
-            if "$ref" in node and isinstance(node["$ref"], str):
-                ref = self._id + node["$ref"]
-                del node["$ref"]
-                if node:
-                    result = JsonReference(  # type: ignore
-                        self, ref, {key: self._process_node(value, key) for key, value in node.items()}
-                    )
-                else:
-                    result = JsonReference(self, ref)  # type: ignore
-
-                self._current_path.pop()
-                return result
-
-            if "$dynamicRef" in node and isinstance(node["$dynamicRef"], str):
-                dynamic_ref = self._id + node["$dynamicRef"]
-                del node["$dynamicRef"]
-                if node:
-                    result = JsonReference(  # type: ignore
-                        self, dynamic_ref, {key: self._process_node(value, key) for key, value in node.items()}
-                    )
-                else:
-                    result = JsonReference(self, dynamic_ref)  # type: ignore
-
-                self._current_path.pop()
-                return result
-
-            result = {key: self._process_node(value, key) for key, value in node.items()}  # type: ignore
-            self._current_path.pop()
-            return result
-
-        self._current_path.pop()
+            return node
+
+        _intern_keys(node)
+        if "$dynamicAnchor" in node:
+            self.anchors[f"#{node['$dynamicAnchor']}"] = _path_parts(node_path)
+            del node["$dynamicAnchor"]
+
+        if "$anchor" in node:
+            self.anchors[f"#{node['$anchor']}"] = _path_parts(node_path)
+            del node["$anchor"]
+
+        for ref_keyword in ("$ref", "$dynamicRef"):
+            if ref_keyword in node and isinstance(node[ref_keyword], str):
+                ref = self._id + node.pop(ref_keyword)
+                return JsonReference(self, ref, node) if node else JsonReference.shared(self, ref)
+
         return node
 
     @property
@@ -297,24 +415,28 @@ class JsonSchema:
     def dump(self) -> Dict:
         return dump(self)
 
-    @lru_cache(maxsize=256)
     def query(self, query: str) -> Any:
-        if query in self.anchors:
-            query = self.anchors[query]
+        fragment = self._query_cache.get(query, _MISSING)
+        if fragment is not _MISSING:
+            return fragment
 
-        query_parts = query.replace("\\/", "&slash;")
-        query_parts = [part.replace("&slash;", "/") for part in query_parts.lstrip("#").strip("/").split("/")]  # type: ignore
         fragment = self.document
-
-        for item in query_parts:
-            if isinstance(fragment, dict):
-                if item not in fragment:
-                    raise LookupError(f"could not resolve query {query}")
-            elif isinstance(fragment, list):
-                item = int(item)
-                if item < 0 or item > len(fragment):
+        pointer = self.anchors.get(query)
+        if pointer is None:
+            pointer = _parse_pointer(query)
+
+        for item in pointer:
+            if isinstance(fragment, list):
+                index = int(item)
+                if index < 0 or index > len(fragment):
                     raise LookupError(f"could not resolve query {query}")
+                fragment = fragment[index]
+                continue
+            if isinstance(fragment, dict) and item not in fragment:
+                raise LookupError(f"could not resolve query {query}")
             fragment = fragment[item]
+
+        self._query_cache[query] = fragment
         return fragment
 
     def __contains__(self, item) -> bool:
@@ -345,6 +467,41 @@ class JsonSchema:
         return self.document.items()
 
 
+def _intern_keys(node: Dict[Any, Any]) -> None:
+    # parsers create new strings for every key, interned keys make keyword lookups compare by identity
+    items = [(sys.intern(key) if type(key) is str else key, value) for key, value in node.items()]
+    node.clear()
+    node.update(items)
+
+
+def _path_parts(node_path: Optional[tuple]) -> Tuple[str, ...]:
+    # node paths are kept as linked `(parent_path, key)` pairs so descending into a node is O(1)
+    parts = []
+    while node_path is not None:
+        node_path, key = node_path
+        parts.append(sys.intern(str(key)))
+
+    return tuple(reversed(parts))
+
+
+@lru_cache(maxsize=4096)
+def _parse_pointer(pointer: str) -> Tuple[str, ...]:
+    # pointers are split once per unique string, segments are unescaped as in rfc 6901 (`~1` and `~0`)
+    pointer = pointer.replace("\\/", "&slash;")
+
+    return tuple(
+        sys.intern(_unescape_pointer_part(part.replace("&slash;", "/")))
+        for part in pointer.lstrip("#").strip("/").split("/")
+    )
+
+
+def _unescape_pointer_part(part: str) -> str:
+    if "~" not in part:
+        return part
+
+    return part.replace("~1", "/").replace("~0", "~")
+
+
 class JsonSchemaStore:
     loaders: Dict[str, URILoader] = {
         "file": FileLoader(),
@@ -353,8 +510,9 @@ class JsonSchemaStore:
 
     @classmethod
     def get(cls, uri: JsonUri) -> JsonSchema:
-        if cls.has(uri):
-            return cls.store[uri.source]
+        schema = cls.store.get(uri.source)
+        if schema is not None:
+            return schema
 
         if uri.protocol not in cls.loaders:
             raise ValueError(f"unsupported protocol {uri.protocol}")
@@ -369,6 +527,13 @@ class JsonSchemaStore:
     def has(cls, uri: JsonUri) -> bool:
         return uri.source in cls.store
 
+    @classmethod
+    def clear(cls) -> None:
+        cls.store.clear()
+        for loader in cls.loaders.values():
+            if isinstance(getattr(loader, "store", None), dict):
+                loader.store.clear()  # type: ignore
+
     @classmethod
     def add_loader(cls, loader: URILoader, protocol: Union[str, List[str]]) -> None:
         if isinstance(protocol, str):
@@ -379,45 +544,43 @@ class JsonSchemaStore:
 
     @classmethod
     def load(cls, uri: JsonUri) -> JsonSchema:
-        if cls.has(uri):
-            return cls.get(uri)
-        if uri.protocol not in cls.loaders:
+        schema = cls.store.get(uri.source)
+        if schema is not None:
+            return schema
+        loader = cls.loaders.get(uri.protocol)
+        if loader is None:
             raise ValueError(f"Unsupported protocol {uri.protocol}, please register protocol loader first.")
-        schema = JsonSchema(cls.loaders[uri.protocol].load(uri), uri.base_uri())
+        schema = JsonSchema(loader.load(uri), uri.base_uri())
         cls.add(uri, schema)
         return schema
 
 
 def _get_cycling_references(node: object) -> Set[JsonReference]:
-    stack = []
-    cycling_references = []
-
-    def _detect(obj: object) -> None:
-        nonlocal cycling_references
-        nonlocal stack
-
-        if not isinstance(obj, (list, dict, JsonReference)):
-            return
-
-        if isinstance(obj, JsonReference) and obj in stack:
-            cycling_references.append(obj)
-            return
-
-        stack.append(obj)
-
-        if isinstance(obj, list):
-            for item in obj:
-                _detect(item)
-        elif isinstance(obj, dict):
-            for key, item in obj.items():
-                _detect(item)
-        elif isinstance(obj, JsonReference):
-            _detect(obj.document)
-        stack.pop()
-
-    _detect(node)
+    # iterative depth first walk, a reference is cycling when it is found again
+    # while its own document is still being visited
+    cycling_references: Set[JsonReference] = set()
+    visiting: Set[int] = set()
+    stack: List[Tuple[bool, Any]] = [(False, node)]
+
+    while stack:
+        leaving, obj = stack.pop()
+        if leaving:
+            visiting.discard(id(obj))
+            continue
+
+        if isinstance(obj, JsonReference):
+            if id(obj) in visiting:
+                cycling_references.add(obj)
+                continue
+            visiting.add(id(obj))
+            stack.append((True, obj))
+            stack.append((False, obj.document))
+        elif isinstance(obj, list):
+            stack.extend((False, item) for item in reversed(obj))
+        elif isinstance(obj, Mapping):
+            stack.extend((False, item) for item in reversed(list(obj.values())))
 
-    return set(cycling_references)
+    return cycling_references
 
 
 def dump(schema: JsonSchema) -> Dict[str, Any]:
@@ -429,7 +592,7 @@ def dump(schema: JsonSchema) -> Dict[str, Any]:
 def _dump_node(node: Union[List, Dict], cycling_references: Set[JsonReference]) -> Union[List, Dict]:
     if isinstance(node, list):
         return [_dump_node(item, cycling_references) for item in node]
-    if isinstance(node, dict):
+    if isinstance(node, Mapping):
         return {key: _dump_node(value, cycling_references) for key, value in node.items()}
     if isinstance(node, JsonReference):
         if node in cycling_references:
@@ -1,13 +1,14 @@
-from functools import partial, lru_cache
-from typing import Any, Callable, Dict, List, Union
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from opyapi.json_schema import JsonSchema
+from opyapi.json_schema import JsonReference, JsonSchema
 from opyapi.errors import ValidationError, AdditionalItemsValidationError
 from opyapi.validators import validate_equal
 from opyapi.validators.array_validators import (
     validate_array,
     validate_tuple,
 )
+from opyapi.validators._regex import compile_pattern
 from opyapi.validators.combining_validators import (
     validate_all_of,
     validate_any_of,
@@ -16,6 +17,7 @@ from opyapi.validators.combining_validators import (
     validate_if_then_else,
 )
 from opyapi.validators.number_validators import (
+    make_integer_range_validator,
     validate_number,
 )
 from opyapi.validators.object_validators import validate_object
@@ -23,8 +25,8 @@ from opyapi.validators.string_validators import (
     validate_string,
 )
 from opyapi.validators import (
+    make_enum_validator,
     validate_boolean,
-    validate_enum,
     validate_null,
     validate_contains,
 )
@@ -65,6 +67,74 @@ STRING_VALIDATOR_PROPERTIES = {
     "format",
 }
 
+_DETECTED_TYPES = ("object", "array", "number", "string")
+_KEYWORD_TYPE_RANKS = {
+    **{keyword: 0 for keyword in OBJECT_VALIDATOR_PROPERTIES},
+    **{keyword: 1 for keyword in ARRAY_VALIDATOR_PROPERTIES},
+    **{keyword: 2 for keyword in NUMERIC_VALIDATOR_PROPERTIES},
+    **{keyword: 3 for keyword in STRING_VALIDATOR_PROPERTIES},
+}
+
+# root keywords handled by `build_validator_for`, collected into a bitmask in a single pass over schema keys
+_TYPE = 1 << 0
+_ANY_OF = 1 << 1
+_ONE_OF = 1 << 2
+_ALL_OF = 1 << 3
+_NOT = 1 << 4
+_ENUM = 1 << 5
+_IF = 1 << 6
+_THEN = 1 << 7
+_ELSE = 1 << 8
+_CONST = 1 << 9
+_DEFAULT = 1 << 10
+_CONTAINS = 1 << 11
+_KEYWORD_BITS = {
+    "type": _TYPE,
+    "anyOf": _ANY_OF,
+    "oneOf": _ONE_OF,
+    "allOf": _ALL_OF,
+    "not": _NOT,
+    "enum": _ENUM,
+    "if": _IF,
+    "then": _THEN,
+    "else": _ELSE,
+    "const": _CONST,
+    "default": _DEFAULT,
+    "contains": _CONTAINS,
+}
+
+
+COMPILED_OBJECT_PROPERTIES = {
+    "type",
+    "properties",
+    "required",
+    "additionalProperties",
+    "minProperties",
+    "maxProperties",
+    "title",
+    "description",
+}
+COMPILED_OBJECT_MAX_PROPERTIES = 32
+
+
+def _is_compiled_object(schema: Any) -> bool:
+    """
+    Detects object schemas with a small, fixed set of properties and no keywords
+    beyond the compiled ones, which are compiled into a single specialized function.
+    """
+    if not isinstance(schema, dict) or schema.get("type") != "object":
+        return False
+    if not isinstance(schema.get("properties"), dict):
+        return False
+    if len(schema["properties"]) > COMPILED_OBJECT_MAX_PROPERTIES:
+        return False
+    if not isinstance(schema.get("additionalProperties", True), (bool, dict)):
+        return False
+
+    return schema.keys() <= COMPILED_OBJECT_PROPERTIES and all(
+        isinstance(item, dict) for item in schema["properties"].values()
+    )
+
 
 def _fail(value: Any, error: ValidationError) -> None:
     error.context["value"] = value
@@ -82,26 +152,21 @@ def _detect_schema_type(definition: Dict[str, Any]) -> str:
     if "type" in definition:
         return definition["type"]
 
-    keys = set(definition.keys())
-
-    if keys & OBJECT_VALIDATOR_PROPERTIES:
-        return "object"
-
-    if keys & ARRAY_VALIDATOR_PROPERTIES:
-        return "array"
+    # types are detected in the order of `_DETECTED_TYPES`, so the lowest ranked keyword wins
+    detected = len(_DETECTED_TYPES)
+    for key in definition.keys():
+        rank = _KEYWORD_TYPE_RANKS.get(key, detected)
+        if rank < detected:
+            detected = rank
+            if not rank:
+                break
 
-    if keys & NUMERIC_VALIDATOR_PROPERTIES:
-        return "number"
-
-    if keys & STRING_VALIDATOR_PROPERTIES:
-        return "string"
-
-    return ""
+    return _DETECTED_TYPES[detected] if detected < len(_DETECTED_TYPES) else ""
 
 
 def build_validator_for(any_schema: Any) -> Callable:
     if isinstance(any_schema, JsonSchema):
-        schema = any_schema.document  # type: ignore
+        schema = _resolve_root_reference(any_schema)
     else:
         schema = any_schema  # type: ignore
 
@@ -112,8 +177,17 @@ def build_validator_for(any_schema: Any) -> Callable:
     elif not schema:
         return lambda value: value
 
+    if _is_compiled_object(schema):
+        from opyapi.codegen import compile_schema  # codegen delegates back to this module
+
+        return compile_schema(schema)
+
+    keywords = 0
+    for key in schema.keys():
+        keywords |= _KEYWORD_BITS.get(key, 0)
+
     root_validators: List[Any] = []
-    if "type" in schema:
+    if keywords & _TYPE:
         if isinstance(schema["type"], list):
             validators = [build_validator_for({"type": item}) for item in schema["type"]]
             root_validators.append(partial(validate_any_of, validators=validators))
@@ -124,53 +198,85 @@ def build_validator_for(any_schema: Any) -> Callable:
         if detected_type:
             root_validators.append(_build_validator_for_type(detected_type, schema, False))
 
-    if "anyOf" in schema:
+    if keywords & _ANY_OF:
         validators = [build_validator_for(item) for item in schema["anyOf"]]
         root_validators.append(partial(validate_any_of, validators=validators))
 
-    if "oneOf" in schema:
+    if keywords & _ONE_OF:
         validators = [build_validator_for(item) for item in schema["oneOf"]]
         root_validators.append(partial(validate_one_of, validators=validators))
 
-    if "allOf" in schema:
+    if keywords & _ALL_OF:
         root_validators.append(_build_all_of_validator(schema["allOf"]))
 
-    if "not" in schema:
+    if keywords & _NOT:
         root_validators.append(partial(validate_not, validator=build_validator_for(schema["not"])))
 
-    if "enum" in schema:
+    if keywords & _ENUM:
         return _build_enum_validator(schema)
 
-    if "if" in schema:
-        if "then" in schema or "else" in schema:
+    if keywords & _IF:
+        if keywords & (_THEN | _ELSE):
             return _build_conditional_validator(schema)
         return lambda x: x  # there is only condition so it is a pass
 
     # there is no `if` keyword in schema but there are `then` and `else` keywords
-    elif "then" in schema or "else" in schema:
+    elif keywords & (_THEN | _ELSE):
         keys = schema.keys() - ["then", "else"]
         if not keys:
             return lambda x: x
 
-    if "const" in schema:
+    if keywords & _CONST:
         return _build_equal_validator(schema)
 
-    if "default" in schema:
+    if keywords & _DEFAULT:
         root_validators.append(partial(_return_default, default=schema["default"]))
 
-    if "contains" in schema:
+    if keywords & _CONTAINS:
         root_validators.append(partial(validate_contains, validator=build_validator_for(schema["contains"])))
 
+    if not root_validators:
+        if "$ref" in schema or "$dynamicRef" in schema:
+            raise ValueError("References can only be resolved within JsonSchema, wrap schema with `JsonSchema`.")
+        return lambda value: value  # annotations only
+
     if len(root_validators) > 1:
-        return partial(validate_all_of, validators=root_validators)
+        return _chain_validators(root_validators)
 
     return root_validators[0]
 
 
-def _build_all_of_validator(items: List) -> Callable:
-    validators = [build_validator_for(item) for item in items]
+def _resolve_root_reference(json_schema: JsonSchema) -> Any:
+    # references in the root node are not replaced when the document is processed, as queries start from it
+    schema = json_schema.document
+    if not isinstance(schema, dict):
+        return schema
+
+    for ref_keyword in ("$ref", "$dynamicRef"):
+        if isinstance(schema.get(ref_keyword), str):
+            siblings = {key: value for key, value in schema.items() if key != ref_keyword}
+            return JsonReference(json_schema, json_schema.id + schema[ref_keyword], siblings)
 
-    return partial(validate_all_of, validators=validators)
+    return schema
+
+
+def _chain_validators(validators: List[Callable]) -> Callable:
+    """
+    Chains validators into a single all-of validator, inlining nested all-of chains
+    so validation runs over one flat sequence of validators instead of a tree.
+    """
+    chain: List[Callable] = []
+    for validator in validators:
+        if isinstance(validator, partial) and validator.func is validate_all_of and not validator.args:
+            chain.extend(validator.keywords["validators"])
+        else:
+            chain.append(validator)
+
+    return partial(validate_all_of, validators=tuple(chain))
+
+
+def _build_all_of_validator(items: List) -> Callable:
+    return _chain_validators([build_validator_for(item) for item in items])
 
 
 def _build_validator_for_type(schema_type: str, definition: Dict[str, Any], strict: bool = True) -> Callable:
@@ -204,19 +310,21 @@ def _build_validator_for_type(schema_type: str, definition: Dict[str, Any], stri
 
 
 def _build_string_validator(definition: Dict[str, Any], strict: bool = True) -> Callable:
-    validator = validate_string
+    kwargs: Dict[str, Any] = {}
 
     if "format" in definition:
-        validator = partial(validator, format_name=definition["format"])
+        kwargs["format_name"] = definition["format"]
 
     if "pattern" in definition:
-        validator = partial(validator, pattern=definition["pattern"])
+        kwargs["pattern"] = compile_pattern(definition["pattern"])
 
     if "minLength" in definition:
-        validator = partial(validator, minimum_length=definition["minLength"])
+        kwargs["minimum_length"] = definition["minLength"]
 
     if "maxLength" in definition:
-        validator = partial(validator, maximum_length=definition["maxLength"])
+        kwargs["maximum_length"] = definition["maxLength"]
+
+    validator: Callable = partial(validate_string, **kwargs) if kwargs else validate_string
 
     if not strict:
         return lambda value: validator(value) if isinstance(value, str) else value
@@ -225,7 +333,7 @@ def _build_string_validator(definition: Dict[str, Any], strict: bool = True) ->
 
 
 def _build_enum_validator(definition: Dict[str, Any]) -> Callable:
-    return partial(validate_enum, values=definition["enum"])
+    return make_enum_validator(definition["enum"])
 
 
 def _build_boolean_validator(strict: bool = False) -> Callable:
@@ -237,129 +345,138 @@ def _build_null_validator(strict: bool = False) -> Callable:
 
 
 def _build_numerical_validator(definition: Dict[str, Any], strict: bool = True) -> Callable:
-    if "type" in definition and definition["type"] == "integer":
-        validator = partial(validate_number, integer=True, strict=strict)
-    else:
-        validator = partial(validate_number, integer=False, strict=strict)
+    kwargs: Dict[str, Any] = {
+        "integer": "type" in definition and definition["type"] == "integer",
+        "strict": strict,
+    }
 
     if "minimum" in definition:
-        validator = partial(validator, minimum=definition["minimum"])
+        kwargs["minimum"] = definition["minimum"]
 
     if "maximum" in definition:
-        validator = partial(validator, maximum=definition["maximum"])
+        kwargs["maximum"] = definition["maximum"]
 
     if "exclusiveMinimum" in definition:
-        validator = partial(validator, exclusive_minimum=definition["exclusiveMinimum"])
+        kwargs["exclusive_minimum"] = definition["exclusiveMinimum"]
 
     if "exclusiveMaximum" in definition:
-        validator = partial(validator, exclusive_maximum=definition["exclusiveMaximum"])
+        kwargs["exclusive_maximum"] = definition["exclusiveMaximum"]
 
     if "multipleOf" in definition:
-        validator = partial(validator, multiple_of=definition["multipleOf"])
+        kwargs["multiple_of"] = definition["multipleOf"]
 
-    return validator
+    if kwargs.keys() == {"integer", "strict", "minimum", "maximum"} and kwargs["integer"] and strict:
+        return make_integer_range_validator(kwargs["minimum"], kwargs["maximum"])
+
+    return partial(validate_number, **kwargs)
 
 
 def _build_array_validator(definition: Dict[str, Any], strict: bool = True) -> Callable:
-    validator = partial(validate_array, strict=strict)
+    kwargs: Dict[str, Any] = {"strict": strict}
 
     if "items" in definition:
         if isinstance(definition["items"], list):
             return _build_tuple_validator(definition, strict)
         elif isinstance(definition["items"], dict):
-            validator = partial(validator, item_validator=build_validator_for(definition["items"]))
+            kwargs["item_validator"] = build_validator_for(definition["items"])
+            integer_items = _integer_constraints(kwargs["item_validator"])
+            if integer_items is not None:
+                kwargs["integer_items"] = integer_items
         elif isinstance(definition["items"], bool):
             if definition["items"]:
-                return validator
+                return partial(validate_array, **kwargs)
             else:
-                return partial(validator, maximum_items=0)
+                return partial(validate_array, maximum_items=0, **kwargs)
 
     if "minItems" in definition:
-        validator = partial(validator, minimum_items=definition["minItems"])
+        kwargs["minimum_items"] = definition["minItems"]
     if "maxItems" in definition:
-        validator = partial(validator, maximum_items=definition["maxItems"])
+        kwargs["maximum_items"] = definition["maxItems"]
 
     if "uniqueItems" in definition and definition["uniqueItems"]:
-        validator = partial(validator, unique_items=True)
+        kwargs["unique_items"] = True
 
-    return validator
+    return partial(validate_array, **kwargs)
+
+
+def _integer_constraints(validator: Callable) -> Optional[Dict[str, Any]]:
+    if hasattr(validator, "integer_constraints"):
+        return validator.integer_constraints  # type: ignore
+    if not isinstance(validator, partial) or validator.func is not validate_number or validator.args:
+        return None
+    keywords = dict(validator.keywords)
+    if keywords.pop("integer", False) is not True or keywords.pop("strict", True) is not True:
+        return None
+
+    return keywords
 
 
 def _build_tuple_validator(definition: Dict[str, Any], strict: bool = False) -> Callable:
-    validator = partial(
-        validate_tuple,
-        item_validator=[build_validator_for(item_schema) for item_schema in definition["items"]],
-        strict=strict,
-    )
+    kwargs: Dict[str, Any] = {
+        "item_validator": [build_validator_for(item_schema) for item_schema in definition["items"]],
+        "strict": strict,
+    }
 
     if "additionalItems" in definition:
         if definition["additionalItems"] is True:
-            validator = partial(validator, additional_items=lambda x: x)
+            kwargs["additional_items"] = lambda x: x
         elif definition["additionalItems"] is False:
-            validator = partial(validator, additional_items=partial(_fail, error=AdditionalItemsValidationError()))
+            kwargs["additional_items"] = partial(_fail, error=AdditionalItemsValidationError())
         elif isinstance(definition["additionalItems"], dict):
-            validator = partial(validator, additional_items=build_validator_for(definition["additionalItems"]))
+            kwargs["additional_items"] = build_validator_for(definition["additionalItems"])
     else:
-        validator = partial(validator, additional_items=lambda x: x)
+        kwargs["additional_items"] = lambda x: x
 
     if "uniqueItems" in definition and definition["uniqueItems"]:
-        validator = partial(validator, unique_items=True)
+        kwargs["unique_items"] = True
 
-    return validator
+    return partial(validate_tuple, **kwargs)
 
 
 def _build_object_validator(definition: Dict[str, Any], strict: bool = False) -> Callable:
-    validator = partial(validate_object, strict=strict)
+    kwargs: Dict[str, Any] = {"strict": strict}
 
     if "propertyNames" in definition:
-        if isinstance(definition["propertyNames"], bool):
-            property_names_validator = build_validator_for(definition["propertyNames"])
-        else:
+        if not isinstance(definition["propertyNames"], bool):
             definition["propertyNames"]["type"] = "string"
-            property_names_validator = build_validator_for(definition["propertyNames"])
-
-        validator = partial(validator, property_names=property_names_validator)
+        kwargs["property_names"] = build_validator_for(definition["propertyNames"])
 
     if "minProperties" in definition:
-        validator = partial(validator, min_properties=int(definition["minProperties"]))
+        kwargs["min_properties"] = int(definition["minProperties"])
 
     if "maxProperties" in definition:
-        validator = partial(validator, max_properties=int(definition["maxProperties"]))
+        kwargs["max_properties"] = int(definition["maxProperties"])
 
     if "required" in definition and definition["required"]:
-        validator = partial(validator, required_properties=definition["required"])
+        kwargs["required_properties"] = definition["required"]
 
     if "dependencies" in definition or "dependentRequired" in definition:
         dependent_key = "dependencies"
         if "dependentRequired" in definition:
             dependent_key = "dependentRequired"
 
-        validator = partial(validator, dependencies=definition[dependent_key])
+        kwargs["dependencies"] = definition[dependent_key]
 
     if "properties" in definition:
-        properties_validator = {
+        kwargs["properties"] = {
             property_name: build_validator_for(property_schema)
             for property_name, property_schema in definition["properties"].items()
         }
-        validator = partial(validator, properties=properties_validator)
 
     if "additionalProperties" in definition:
-        additional_properties_validator = definition["additionalProperties"]
-        if not isinstance(additional_properties_validator, bool):
-            validator = partial(
-                validator, additional_properties=build_validator_for(definition["additionalProperties"])
-            )
+        if isinstance(definition["additionalProperties"], bool):
+            kwargs["additional_properties"] = definition["additionalProperties"]
         else:
-            validator = partial(validator, additional_properties=definition["additionalProperties"])
+            kwargs["additional_properties"] = build_validator_for(definition["additionalProperties"])
 
     if "patternProperties" in definition:
-        pattern_properties_validator = {
-            key: build_validator_for(value) for key, value in definition["patternProperties"].items()
+        kwargs["pattern_properties"] = {
+            compile_pattern(key): build_validator_for(value) for key, value in definition["patternProperties"].items()
         }
-        validator = partial(validator, pattern_properties=pattern_properties_validator)
 
+    validator = partial(validate_object, **kwargs)
     if "if" in definition and ("then" in definition or "else" in definition):
-        validator = _build_all_of_validator([validator, _build_conditional_validator(definition)])  # type: ignore
+        return _chain_validators([validator, _build_conditional_validator(definition)])
 
     return validator
 
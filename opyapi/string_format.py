@@ -1,5 +1,7 @@
-from typing import Callable
+import re
+from typing import Callable, Dict, Pattern, Union
 
+from opyapi.errors import FormatValidationError
 from opyapi.validators.format_validators import (
     validate_format_boolean,
     validate_format_bytes,
@@ -63,20 +65,47 @@ class _StringFormat:
             self.UUID: validate_format_uuid,
             self.PASSWORD: validate_format_password
         }
+        # patterns of regex backed formats, validated without calling the format
+        self.regex_formats: Dict[str, Pattern] = {}
 
     def __getitem__(self, format_name: str) -> Callable:
         if format_name in self._formats:
             return self._formats[format_name]
         raise KeyError(f"Unsupported format {format_name}")
 
-    def __setitem__(self, format_name: str, value: Callable) -> None:
+    def __setitem__(self, format_name: str, value: Union[Callable, Pattern]) -> None:
+        if isinstance(value, re.Pattern):
+            value = RegexFormat(value, format_name)
+        elif isinstance(value, RegexFormat) and not value.format_name:
+            value.format_name = format_name
         self._formats[format_name] = value
 
+        if isinstance(value, RegexFormat) and value.format_name == format_name:
+            self.regex_formats[format_name] = value.pattern
+        else:
+            self.regex_formats.pop(format_name, None)
+
     def __contains__(self, format_name: str) -> bool:
         return format_name in self._formats
 
 
+class RegexFormat:
+    """
+    String format backed by a regular expression, the pattern is compiled once
+    when format is created.
+    """
+
+    def __init__(self, pattern: Union[str, Pattern], format_name: str = ""):
+        self.pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
+        self.format_name = format_name
+
+    def __call__(self, value: str) -> str:
+        if self.pattern.match(value):
+            return value
+        raise FormatValidationError(expected_format=self.format_name or self.pattern.pattern)
+
+
 StringFormat = _StringFormat()
 
 
-__all__ = ["StringFormat"]
+__all__ = ["StringFormat", "RegexFormat"]
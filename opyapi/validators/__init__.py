@@ -1,4 +1,5 @@
-from typing import Any, List, Union, Callable
+from functools import partial
+from typing import Any, Callable, FrozenSet, List, Optional, Union
 
 from opyapi.errors import EqualityValidationError, TypeValidationError, EnumValidationError, ContainsValidationError
 from .array_validators import (
@@ -21,6 +22,7 @@ from .number_validators import (
     validate_multiple_of,
     validate_number,
     validate_integer,
+    make_integer_range_validator,
 )
 from .object_validators import validate_object
 
@@ -34,7 +36,7 @@ from .string_validators import (
 
 
 def validate_contains(value: Any, validator: Callable) -> Any:
-    if not isinstance(value, list):
+    if type(value) is not list and not isinstance(value, list):
         return value
 
     contains = False
@@ -79,7 +81,17 @@ def validate_boolean(value: Any, strict: bool = True) -> bool:
     return value
 
 
-def validate_enum(value: Any, values: List[Union[str, int, float, bool]]) -> Union[str, int, float, bool]:
+def validate_enum(
+    value: Any, values: List[Union[str, int, float, bool]], members: Optional[FrozenSet] = None
+) -> Union[str, int, float, bool]:
+    if members is not None:
+        try:
+            if (type(value) is bool, value) in members:
+                return value
+        except TypeError:  # unhashable values cannot be members of hashable enum
+            pass
+        raise EnumValidationError(expected_values=values)
+
     for item in values:
         if value != item:
             continue
@@ -95,6 +107,37 @@ def validate_enum(value: Any, values: List[Union[str, int, float, bool]]) -> Uni
     raise EnumValidationError(expected_values=values)
 
 
+def enum_members(values: List[Any]) -> Optional[FrozenSet]:
+    """
+    Returns enum values as a set that keeps booleans apart from integers,
+    or None if any of the values is unhashable.
+    """
+    try:
+        return frozenset((type(item) is bool, item) for item in values)
+    except TypeError:
+        return None
+
+
+def make_enum_validator(values: List[Any]) -> Callable:
+    """
+    Returns enum validator for passed values. Hashable values are bound in a closure,
+    so validation is a single set lookup, other values fall back to `validate_enum`.
+    """
+    members = enum_members(values)
+    if members is None:
+        return partial(validate_enum, values=values)
+
+    def _validate_enum(value: Any) -> Any:
+        try:
+            if (type(value) is bool, value) in members:  # type: ignore
+                return value
+        except TypeError:  # unhashable values cannot be members of hashable enum
+            pass
+        raise EnumValidationError(expected_values=values)
+
+    return _validate_enum
+
+
 def validate_nullable(value: Any, validator: Callable) -> Any:
     if value is None:
         return None
@@ -118,11 +161,14 @@ __all__ = [
     "validate_tuple",
     "validate_boolean",
     "validate_enum",
+    "enum_members",
+    "make_enum_validator",
     "validate_equal",
     "validate_null",
     "validate_nullable",
     "validate_number",
     "validate_integer",
+    "make_integer_range_validator",
     "validate_string",
     "validate_maximum_items",
     "validate_minimum_items",
@@ -0,0 +1,63 @@
+import json
+from functools import lru_cache, wraps
+from typing import Any, Callable, Optional, Tuple
+
+
+class _PayloadKey:
+    """
+    Hashes validated payload by its type and canonical json form, the payload itself is carried
+    along so the memoized validator can be called with it on a cache miss.
+    """
+
+    __slots__ = ("key", "value", "_hash")
+
+    def __init__(self, key: Tuple[type, str], value: Any):
+        self.key = key
+        self.value = value
+        self._hash = hash(key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _PayloadKey) and self.key == other.key
+
+
+def _frozen_json(value: Any) -> Optional[Tuple[type, str]]:
+    # json serializes tuples as lists, the root type keeps e.g. `(1, 2)` and `[1, 2]` apart
+    try:
+        return type(value), json.dumps(value, sort_keys=True)
+    except (TypeError, ValueError):  # values which are not json serializable are never memoized
+        return None
+
+
+def memoized_validator(validator: Optional[Callable] = None, *, maxsize: int = 5000) -> Callable:
+    """
+    Memoizes results of passed validator by the type and canonical json form of the validated
+    value, so re-validating the same payload (e.g. retried webhooks) costs a single `json.dumps`.
+    Only successful validations are memoized and cached results are shared between calls,
+    they should not be mutated. Meant for payloads decoded from json, where all keys are
+    strings and nested arrays are lists. Can be used as a decorator, with or without the
+    `maxsize` argument.
+    """
+    if validator is None:
+        return lambda func: memoized_validator(func, maxsize=maxsize)
+
+    @lru_cache(maxsize=maxsize)
+    def _validate_payload(payload: _PayloadKey) -> Any:
+        return validator(payload.value)  # type: ignore
+
+    @wraps(validator)
+    def _validate(value: Any) -> Any:
+        key = _frozen_json(value)
+        if key is None:
+            return validator(value)  # type: ignore
+
+        return _validate_payload(_PayloadKey(key, value))
+
+    _validate.cache_clear = _validate_payload.cache_clear  # type: ignore
+
+    return _validate
+
+
+__all__ = ["memoized_validator"]
@@ -0,0 +1,44 @@
+import re
+from functools import lru_cache
+from typing import Pattern
+
+try:
+    import re2  # type: ignore
+except ImportError:  # google-re2 is optional
+    re2 = None
+
+_use_re2 = False
+
+
+def use_re2(enabled: bool = True) -> None:
+    """
+    Enables matching schema patterns with google-re2, which guarantees linear time matching.
+    re2 matches differently than python's `re` module, e.g. `\\d`, `\\w`, `\\s` and `\\b` only
+    match ascii characters and `$` does not match before a trailing newline, so it has to be
+    enabled explicitly. Validators built before the call keep their compiled patterns.
+    """
+    global _use_re2
+    if enabled and re2 is None:
+        raise ImportError("google-re2 has to be installed to match patterns with re2")
+
+    _use_re2 = enabled
+    compile_pattern.cache_clear()
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str) -> Pattern:
+    """
+    Compiles schema pattern with python's `re` module, or with google-re2 when it was enabled
+    with `use_re2`. Patterns re2 does not support (e.g. lookarounds or backreferences) are
+    always compiled with python's `re` module.
+    """
+    if _use_re2:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+
+    return re.compile(pattern)
+
+
+__all__ = ["compile_pattern", "use_re2"]
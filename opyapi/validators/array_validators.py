@@ -1,4 +1,5 @@
-from typing import Callable, List, Any
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional
 
 from opyapi.errors import (
     AdditionalItemsValidationError,
@@ -30,18 +31,13 @@ def validate_tuple(
     unique_items: bool = False,
     strict: bool = False,
 ) -> list:
-    if not isinstance(value, list):
+    if type(value) is not list and not isinstance(value, list):
         if not strict:
             return value
         raise TypeValidationError(expected_type="array", actual_type=type(value))
 
-    if unique_items:
-        unique_values = [_wrap_booleans(item) for item in value]
-        seen = []
-        for item in unique_values:
-            if item in seen:
-                raise UniqueItemsValidationError()
-            seen.append(item)
+    if unique_items and has_duplicates(value):
+        raise UniqueItemsValidationError()
 
     list_length = len(value)
     validators_length = len(item_validator)
@@ -49,41 +45,93 @@ def validate_tuple(
     if list_length > validators_length and additional_items is None:
         raise AdditionalItemsValidationError()
 
-    for i in range(0, list_length):
-        if i < validators_length:
-            value[i] = item_validator[i](value[i])
-            continue
+    result = [validator(item) for validator, item in zip(item_validator, value)]
+    if list_length > validators_length:
+        result.extend(map(additional_items, islice(value, validators_length, None)))  # type: ignore
 
-        value[i] = additional_items(value[i])  # type: ignore
-
-    return value
-
-
-class _Bool:
-    """Python's booleans are ints and this is causing a lot of issues
-    with uniqueness checks. This wrapper class allow us to fix those
-    issues.
-    """
+    return result
 
-    def __init__(self, value):
-        self.value = value
 
-    def __eq__(self, other):
-        if isinstance(other, _Bool) and other.value is self.value:
-            return True
+def _unique_key(value: Any) -> Any:
+    # booleans are tagged so they do not collide with 0 and 1, other numbers keep comparing by value
+    value_type = type(value)
+    if value_type is bool:
+        return bool, value
+    if value_type is list:
+        return list, tuple(_unique_key(item) for item in value)
+    if value_type is dict:
+        return dict, frozenset((key, _unique_key(item)) for key, item in value.items())
+    return None, value
+
+
+def _strict_equal(left: Any, right: Any) -> bool:
+    # booleans only equal booleans at every depth, so `True == 1` does not make items equal
+    left_type = type(left)
+    right_type = type(right)
+    if left_type is bool or right_type is bool:
+        return left is right
+    if left_type is list or right_type is list:
+        return (
+            left_type is right_type
+            and len(left) == len(right)
+            and all(_strict_equal(a, b) for a, b in zip(left, right))
+        )
+    if left_type is dict or right_type is dict:
+        return (
+            left_type is right_type
+            and left.keys() == right.keys()
+            and all(_strict_equal(item, right[key]) for key, item in left.items())
+        )
+    return left == right
+
+
+_SCALAR_TYPES = frozenset({int, float, str, type(None)})
+
+
+def has_duplicates(value: list) -> bool:
+    # arrays of scalars other than booleans compare by plain equality, so a set of the items is enough
+    if _SCALAR_TYPES.issuperset(map(type, value)):
+        return len(set(value)) != len(value)
+
+    seen = set()
+    unhashable_seen: List[Any] = []
+    for item in value:
+        try:
+            key = _unique_key(item)
+            if key in seen:
+                return True
+            seen.add(key)
+        except TypeError:  # unhashable items are compared one by one
+            if any(_strict_equal(item, seen_item) for seen_item in unhashable_seen):
+                return True
+            unhashable_seen.append(item)
+
+    return False
+
+
+def _is_valid_integer_array(
+    value: list,
+    minimum: Any = None,
+    maximum: Any = None,
+    exclusive_minimum: Any = None,
+    exclusive_maximum: Any = None,
+    multiple_of: Any = None,
+) -> bool:
+    # checks all items at once with builtins iterating in C, bools and other types are left to item validator
+    if set(map(type, value)) != {int}:
+        return False
+    if minimum is not None and min(value) < minimum:
+        return False
+    if maximum is not None and max(value) > maximum:
+        return False
+    if exclusive_minimum is not None and min(value) <= exclusive_minimum:
+        return False
+    if exclusive_maximum is not None and max(value) >= exclusive_maximum:
+        return False
+    if multiple_of is not None and (type(multiple_of) is not int or any(map(multiple_of.__rmod__, value))):
         return False
 
-
-def _wrap_booleans(value: Any) -> Any:
-    if type(value) == bool:
-        if value:
-            return _Bool(1)
-        return _Bool(0)
-    if type(value) == list:
-        return [_wrap_booleans(item) for item in value]
-    if type(value) == dict:
-        return {key: _wrap_booleans(item) for key, item in value.items()}
-    return value
+    return True
 
 
 def validate_array(
@@ -93,27 +141,26 @@ def validate_array(
     maximum_items: int = -1,
     unique_items: bool = False,
     strict: bool = True,
+    integer_items: Optional[Dict[str, Any]] = None,
 ) -> list:
-    if not isinstance(value, list):
+    """
+    `integer_items` holds numeric constraints of `item_validator` when it only accepts integers,
+    arrays of plain integers meeting them are accepted without calling `item_validator` per item.
+    """
+    if type(value) is not list and not isinstance(value, list):
         if not strict:
             return value
         raise TypeValidationError(expected_type="array", actual_type=type(value))
 
-    result = []
-    if item_validator:
-        for item in value:
-            result.append(item_validator(item))
+    if integer_items is not None and _is_valid_integer_array(value, **integer_items):
+        result = list(value)
+    elif item_validator:
+        result = list(map(item_validator, value))
     else:
         result = value
 
-    # python fails to check in sets against bool and integers so we have to run this in two loops
-    if unique_items:
-        unique_values = [_wrap_booleans(item) for item in value]
-        seen = []
-        for item in unique_values:
-            if item in seen:
-                raise UniqueItemsValidationError()
-            seen.append(item)
+    if unique_items and has_duplicates(value):
+        raise UniqueItemsValidationError()
 
     if minimum_items > -1:
         validate_minimum_items(result, minimum_items)
@@ -128,4 +175,5 @@ __all__ = [
     "validate_minimum_items",
     "validate_tuple",
     "validate_array",
+    "has_duplicates",
 ]
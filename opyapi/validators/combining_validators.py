@@ -1,7 +1,6 @@
 from typing import Any, Callable, Iterable
-from copy import deepcopy
 
-from opyapi.errors import ValidationError
+from opyapi.errors import AnyOfValidationError, ValidationError
 
 
 def validate_all_of(value: Any, validators: Iterable[Callable]) -> Any:
@@ -13,11 +12,11 @@ def validate_all_of(value: Any, validators: Iterable[Callable]) -> Any:
 def validate_any_of(value: Any, validators: Iterable[Callable]) -> Any:
     for validate in validators:
         try:
-            return validate(deepcopy(value))
+            return validate(value)
         except ValueError:
             continue
 
-    raise ValidationError(f"Value could not be validated: {value}", code="any_error")
+    raise AnyOfValidationError(value=value)
 
 
 def validate_one_of(value: Any, validators: Iterable[Callable]) -> Any:
@@ -26,7 +25,7 @@ def validate_one_of(value: Any, validators: Iterable[Callable]) -> Any:
 
     for validate in validators:
         try:
-            result = validate(deepcopy(value))
+            result = validate(value)
             valid_count += 1
         except ValueError:
             continue
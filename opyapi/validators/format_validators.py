@@ -3,22 +3,22 @@ import re
 from datetime import time
 from decimal import Decimal
 from ipaddress import AddressValueError, IPv4Address, IPv6Address
-from typing import Any
+from typing import Any, Final
 from uuid import UUID
 
 from opyapi.errors import FormatValidationError
 
-ISO_8601_DATETIME_REGEX = re.compile(
+ISO_8601_DATETIME_REGEX: Final = re.compile(
     r"^(\d{4})-?([0-1]\d)-?([0-3]\d)[t\s]?([0-2]\d:?[0-5]\d:?[0-5]\d|23:59:60|235960)(\.\d+)?(z|[+-]\d{2}:\d{2})?$",
     re.I,
 )
-ISO_8601_DATE_REGEX = re.compile(r"^(\d{4})-?([0-1]\d)-?([0-3]\d)$", re.I)
-ISO_8601_TIME_REGEX = re.compile(
+ISO_8601_DATE_REGEX: Final = re.compile(r"^(\d{4})-?([0-1]\d)-?([0-3]\d)$", re.I)
+ISO_8601_TIME_REGEX: Final = re.compile(
     r"^(?P<time>[0-2]\d:?[0-5]\d:?[0-5]\d|23:59:60|235960)(?P<microseconds>\.\d+)?(?P<tzpart>z|[+-]\d{2}:\d{2})?$",
     re.I,
 )
 
-ISO_8601_TIME_DURATION_REGEX = re.compile(
+ISO_8601_TIME_DURATION_REGEX: Final = re.compile(
     r"^(?P<sign>-?)P(?=\d|T\d)(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?$",
     re.I,
 )
@@ -42,28 +42,55 @@ def validate_format_bytes(value: Any) -> bytes:
     raise FormatValidationError(expected_format="byte")
 
 
-FALSY_EXPRESSION = {0, "0", "no", "n", "nope", "false", "f", "off"}
-TRUTHY_EXPRESSION = {1, "1", "ok", "yes", "y", "yup", "true", "t", "on"}
+# expressions are keyed by their type, so `True == 1` does not make floats or other types match by accident
+FALSY_EXPRESSION: Final = frozenset(
+    {(bool, False), (int, 0), *((str, item) for item in ("0", "no", "n", "nope", "false", "f", "off"))}
+)
+TRUTHY_EXPRESSION: Final = frozenset(
+    {(bool, True), (int, 1), *((str, item) for item in ("1", "ok", "yes", "y", "yup", "true", "t", "on"))}
+)
 
 
 def validate_format_boolean(value: Any) -> str:
-    if value in FALSY_EXPRESSION:
-        return value
-
-    if value in TRUTHY_EXPRESSION:
-        return value
+    try:
+        key = (type(value), value)
+        if key in FALSY_EXPRESSION or key in TRUTHY_EXPRESSION:
+            return value
+    except TypeError:  # unhashable values are never boolean expressions
+        pass
 
     raise FormatValidationError(expected_format="boolean")
 
 
+def _is_extended_date(value: str) -> bool:
+    # fast path for the common `YYYY-MM-DD` form, accepts the same strings as ISO_8601_DATE_REGEX
+    return (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdecimal()
+        and value[5] in "01"
+        and value[6].isdecimal()
+        and value[8] in "0123"
+        and value[9].isdecimal()
+    )
+
+
 def validate_format_datetime(value: Any) -> str:
+    if (
+        len(value) > 18
+        and value[10] in "Tt "
+        and _is_extended_date(value[:10])
+        and ISO_8601_TIME_REGEX.match(value[11:])
+    ):
+        return value
     if ISO_8601_DATETIME_REGEX.match(value):
         return value
     raise FormatValidationError(expected_format="date-time")
 
 
 def validate_format_date(value: Any) -> str:
-    if ISO_8601_DATE_REGEX.match(value):
+    if _is_extended_date(value) or ISO_8601_DATE_REGEX.match(value):
         return value
 
     raise FormatValidationError(expected_format="date")
@@ -84,10 +111,8 @@ def validate_format_time_duration(value: Any) -> str:
 
 
 # https://www.w3.org/TR/html5/forms.html#valid-e-mail-address
-EMAIL_REGEX = re.compile(
-    r"^[a-zA-Z0-9.!#$%&'*+\/=?^_`{|}~-]+"
-    r"@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$",
-    re.I,
+EMAIL_LOCAL_PART_CHARACTERS: Final = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.!#$%&'*+/=?^_`{|}~-"
 )
 
 
@@ -96,7 +121,9 @@ def validate_format_email(value: str) -> str:
     Keep in mind this validator willfully violates RFC 5322, the best way to invalidate email address is to send
     a message and receive confirmation from the recipient.
     """
-    if not EMAIL_REGEX.match(value):
+    # local part is checked against its character set, domain part is a hostname
+    local_part, _, domain = value.partition("@")
+    if not local_part or not EMAIL_LOCAL_PART_CHARACTERS.issuperset(local_part) or not HOSTNAME_REGEX.match(domain):
         raise FormatValidationError(expected_format="email")
     if ".." in value:
         raise FormatValidationError(expected_format="email")
@@ -104,7 +131,7 @@ def validate_format_email(value: str) -> str:
     return value
 
 
-HOSTNAME_REGEX = re.compile(
+HOSTNAME_REGEX: Final = re.compile(
     r"^[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?(?:\.[a-z0-9](?:[-0-9a-z]{0,61}[0-9a-z])?)*$",
     re.I,
 )
@@ -119,14 +146,15 @@ def validate_format_hostname(value: str) -> str:
 
 def validate_format_decimal(value: Any) -> str:
     if isinstance(value, Decimal):
-        return str(value)
-
-    try:
-        converted = Decimal(value)
-        if not converted.is_finite():
+        converted = value
+        value = str(value)
+    else:
+        try:
+            converted = Decimal(value)
+        except Exception:
             raise FormatValidationError(expected_format="decimal")
 
-    except Exception:
+    if not converted.is_finite():
         raise FormatValidationError(expected_format="decimal")
 
     return value
@@ -160,7 +188,7 @@ def validate_format_ip_address(value: Any) -> str:
             raise FormatValidationError(expected_format="ip-address")
 
 
-SEMVER_REGEX = re.compile(
+SEMVER_REGEX: Final = re.compile(
     r"^((([0-9]+)\.([0-9]+)\.([0-9]+)(?:-([0-9a-z-]+(?:\.[0-9a-z-]+)*))?)(?:\+([0-9a-z-]+(?:\.[0-9a-z-]+)*))?)$",
     re.I,
 )
@@ -174,7 +202,7 @@ def validate_format_semver(value: Any) -> str:
     return value
 
 
-URI_REGEX = re.compile(r"^(?:[a-z][a-z0-9+-.]*:)(?:\\/?\\/)?[^\s]*$", re.I)
+URI_REGEX: Final = re.compile(r"^(?:[a-z][a-z0-9+-.]*:)(?:\\/?\\/)?[^\s]*$", re.I)
 
 
 def validate_format_uri(value: Any) -> str:
@@ -185,8 +213,9 @@ def validate_format_uri(value: Any) -> str:
     return value
 
 
-URL_REGEX = re.compile(
-    r"^(?:(?:https?|ftp):\/\/)(?:\S+(?::\S*)?@)?(?:(?!10(?:\.\d{1,3}){3})(?!127(?:\.\d{1,3}){3})(?!169\.254(?:\.\d{1,3}){2})(?!192\.168(?:\.\d{1,3}){2})(?!172\.(?:1[6-9]|2\d|3[0-1])(?:\.\d{1,3}){2})(?:[1-9]\d?|1\d\d|2[01]\d|22[0-3])(?:\.(?:1?\d{1,2}|2[0-4]\d|25[0-5])){2}(?:\.(?:[1-9]\d?|1\d\d|2[0-4]\d|25[0-4]))|(?:(?:[a-z\u00a1-\uffff0-9_]+-?)*[a-z\u00a1-\uffff0-9_]+)(?:\.(?:[a-z\u00a1-\uffff0-9_]+-?)*[a-z\u00a1-\uffff0-9_]+)*(?:\.(?:[a-z\u00a1-\uffff]{2,})))(?::\d{2,5})?(?:\/[^\s]*)?$",
+# host labels are matched as hyphen separated runs, nested quantifiers made the pattern backtrack exponentially
+URL_REGEX: Final = re.compile(
+    r"^(?:(?:https?|ftp):\/\/)(?:\S+(?::\S*)?@)?(?:(?!10(?:\.\d{1,3}){3})(?!127(?:\.\d{1,3}){3})(?!169\.254(?:\.\d{1,3}){2})(?!192\.168(?:\.\d{1,3}){2})(?!172\.(?:1[6-9]|2\d|3[0-1])(?:\.\d{1,3}){2})(?:[1-9]\d?|1\d\d|2[01]\d|22[0-3])(?:\.(?:1?\d{1,2}|2[0-4]\d|25[0-5])){2}(?:\.(?:[1-9]\d?|1\d\d|2[0-4]\d|25[0-4]))|(?:[a-z\u00a1-\uffff0-9_]+(?:-[a-z\u00a1-\uffff0-9_]+)*)(?:\.[a-z\u00a1-\uffff0-9_]+(?:-[a-z\u00a1-\uffff0-9_]+)*)*(?:\.(?:[a-z\u00a1-\uffff]{2,})))(?::\d{2,5})?(?:\/[^\s]*)?$",
     re.I | re.U,
 )
 
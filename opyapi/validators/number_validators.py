@@ -1,6 +1,6 @@
 from decimal import Decimal
-from functools import partial
-from typing import Union
+from functools import lru_cache, partial
+from typing import Any, Callable, Union
 from numbers import Number
 
 from opyapi.errors import (
@@ -13,6 +13,7 @@ from opyapi.errors import (
 )
 
 NumberUnion = Union[int, float, Decimal]
+_NUMBER_TYPES = (int, float, Decimal)
 
 
 def validate_number(
@@ -25,28 +26,32 @@ def validate_number(
     integer: bool = False,
     strict: bool = True,
 ) -> NumberUnion:
-    if not strict and not isinstance(value, (int, float, Decimal)):
+    # exact type checks cover the common cases, isinstance is only used for subclasses and other numbers
+    value_type = type(value)
+    if not strict and value_type not in _NUMBER_TYPES and not isinstance(value, _NUMBER_TYPES):
         return value
 
-    if value is True or value is False:
-        raise TypeValidationError(expected_type=int if integer else Number, actual_type=type(value))
+    if value_type is bool:
+        raise TypeValidationError(expected_type=int if integer else Number, actual_type=value_type)
 
-    if integer is True and not isinstance(value, int):
-        raise TypeValidationError(expected_type=int, actual_type=type(value))
-    elif not isinstance(value, Number):
-        raise TypeValidationError(expected_type=Number, actual_type=type(value))
+    if integer is True:
+        if value_type is not int and not isinstance(value, int):
+            raise TypeValidationError(expected_type=int, actual_type=value_type)
+    elif value_type not in _NUMBER_TYPES and not isinstance(value, Number):
+        raise TypeValidationError(expected_type=Number, actual_type=value_type)
 
-    if minimum is not None:
-        validate_minimum(value, minimum)
+    # bound checks are inlined, so validating a number does not cost a function call per keyword
+    if minimum is not None and not value >= minimum:
+        raise MinimumValidationError(expected_minimum=minimum)
 
-    if maximum is not None:
-        validate_maximum(value, maximum)
+    if maximum is not None and not value <= maximum:
+        raise MaximumValidationError(expected_maximum=maximum)
 
-    if exclusive_maximum is not None:
-        validate_exclusive_maximum(value, exclusive_maximum)
+    if exclusive_maximum is not None and not value < exclusive_maximum:
+        raise ExclusiveMaximumValidationError(expected_maximum=exclusive_maximum)
 
-    if exclusive_minimum is not None:
-        validate_exclusive_minimum(value, exclusive_minimum)
+    if exclusive_minimum is not None and not value > exclusive_minimum:
+        raise ExclusiveMinimumValidationError(expected_minimum=exclusive_minimum)
 
     if multiple_of is not None:
         validate_multiple_of(value, multiple_of)
@@ -57,8 +62,35 @@ def validate_number(
 validate_integer = partial(validate_number, integer=True)
 
 
+def make_integer_range_validator(minimum: NumberUnion, maximum: NumberUnion) -> Callable:
+    """
+    Returns strict integer validator for inclusive range. Plain ints are checked with
+    a single chained comparison, all other values fall back to `validate_number`.
+    """
+
+    def _validate_integer_range(value: Any) -> Any:
+        if type(value) is int and minimum <= value <= maximum:
+            return value
+
+        return validate_number(value, minimum=minimum, maximum=maximum, integer=True)
+
+    _validate_integer_range.integer_constraints = {"minimum": minimum, "maximum": maximum}  # type: ignore
+
+    return _validate_integer_range
+
+
+@lru_cache(maxsize=256, typed=True)
+def _decimal_multiple_of(multiple_of: NumberUnion) -> Decimal:
+    # `multipleOf` is a schema constant, so its decimal form is parsed once instead of on every validation
+    return Decimal(str(multiple_of))
+
+
 def validate_multiple_of(value: NumberUnion, multiple_of: NumberUnion) -> NumberUnion:
-    if Decimal(str(value)) % Decimal(str(multiple_of)) != 0:  # type: ignore
+    # integer modulo is exact, so the decimal conversion is only needed when a float or decimal is involved
+    if type(value) is int and type(multiple_of) is int:
+        if value % multiple_of != 0:
+            raise MultipleOfValidationError(multiple_of=multiple_of)
+    elif Decimal(str(value)) % _decimal_multiple_of(multiple_of) != 0:  # type: ignore
         raise MultipleOfValidationError(multiple_of=multiple_of)
 
     return value
@@ -100,4 +132,5 @@ __all__ = [
     "validate_multiple_of",
     "validate_number",
     "validate_integer",
+    "make_integer_range_validator",
 ]
@@ -1,5 +1,4 @@
-import re
-from typing import Callable, Dict, List, Union, Any
+from typing import Callable, Dict, List, Pattern, Union, Any
 
 from opyapi.errors import (
     AdditionalPropertiesValidationError,
@@ -12,9 +11,10 @@ from opyapi.errors import (
     TypeValidationError,
     PropertyNameValidationError,
 )
+from opyapi.validators._regex import compile_pattern
 
 
-def _validate_property(key: str, value: Any, validator: Callable) -> Any:
+def validate_property(key: str, value: Any, validator: Callable) -> Any:
     try:
         return validator(value)
     except PropertyValueValidationError as error:
@@ -41,18 +41,51 @@ def validate_object(
     min_properties: int = -1,
     max_properties: int = -1,
     required_properties: List[str] = None,
-    pattern_properties: Dict[str, Callable] = None,
+    pattern_properties: Dict[Union[str, Pattern], Callable] = None,
     additional_properties: Union[bool, Callable] = True,
     property_names: Callable = None,
     dependencies: Dict[str, List[str]] = None,
     strict: bool = True,
 ) -> dict:
-    if not isinstance(obj, dict):
+    if type(obj) is not dict and not isinstance(obj, dict):
         if not strict:
             return obj
         raise TypeValidationError(expected_type="object", actual_type=type(obj))
 
-    evaluated_properties = []
+    if min_properties >= 0 and len(obj) < min_properties:
+        raise MinimumPropertiesValidationError(expected_minimum=min_properties)
+
+    if 0 <= max_properties < len(obj):
+        raise MaximumPropertiesValidationError(expected_maximum=max_properties)
+
+    if required_properties:
+        for property_name in required_properties:
+            if property_name not in obj:
+                raise RequiredPropertyValidationError(property_name=property_name)
+
+    # open objects without per property rules only need their keys to be strings
+    if (
+        not properties
+        and not pattern_properties
+        and additional_properties is True
+        and property_names is None
+        and not dependencies
+        and set(map(type, obj)) <= {str}
+    ):
+        return dict(obj)
+
+    # builders pass compiled patterns, plain strings are still accepted from direct calls
+    pattern_searches = [
+        (compile_pattern(name_pattern).search if isinstance(name_pattern, str) else name_pattern.search, validator)
+        for name_pattern, validator in (pattern_properties or {}).items()
+    ]
+
+    # per key lookups are resolved once, so the loop below is the only pass over the object
+    if properties is None:
+        properties = {}
+    additional_validator = additional_properties if callable(additional_properties) else None
+    reject_additional = additional_properties is False
+
     new_obj = {}
     for key, value in obj.items():
         if property_names:
@@ -62,27 +95,24 @@ def validate_object(
                 raise PropertyNameValidationError(
                     sub_code=error.code, property_name=key, validation_error=str(error)
                 ) from error
-        elif not isinstance(key, str):  # property names should by default be strings
+        elif type(key) is not str and not isinstance(key, str):  # property names should by default be strings
             raise PropertyNameValidationError(
                 sub_code="type_error", property_name=key, validation_error=f"Expected string type, got {type(key)}"
             )
 
         property_validator = None
-        if pattern_properties:
-            for name_pattern, validator in pattern_properties.items():
-                if re.search(name_pattern, key):
-                    property_validator = validator
-                    break
-
-        if not property_validator and properties and key in properties:
-            property_validator = properties[key]
-        elif not property_validator and callable(additional_properties):
-            property_validator = additional_properties
-        elif not property_validator and additional_properties is False:
-            raise AdditionalPropertiesValidationError(property_name=key)
+        for search, validator in pattern_searches:
+            if search(key):
+                property_validator = validator
+                break
+
+        if property_validator is None:
+            property_validator = properties.get(key, additional_validator)
+            if property_validator is None and reject_additional:
+                raise AdditionalPropertiesValidationError(property_name=key)
 
         if property_validator:
-            new_obj[key] = _validate_property(key, value, property_validator)
+            new_obj[key] = validate_property(key, value, property_validator)
         else:
             new_obj[key] = value
 
@@ -90,22 +120,10 @@ def validate_object(
             if not all(k in obj for k in dependencies[key]):
                 raise DependencyValidationError(property=key, dependencies=dependencies[key])
 
-        evaluated_properties.append(key)
-
-    if min_properties >= 0 and len(evaluated_properties) < min_properties:
-        raise MinimumPropertiesValidationError(expected_minimum=min_properties)
-
-    if 0 <= max_properties < len(evaluated_properties):
-        raise MaximumPropertiesValidationError(expected_maximum=max_properties)
-
-    if required_properties:
-        missing_properties = set(required_properties) - set(evaluated_properties)
-        if missing_properties:
-            raise RequiredPropertyValidationError(property_name=missing_properties.pop())
-
     return new_obj
 
 
 __all__ = [
     "validate_object",
+    "validate_property",
 ]
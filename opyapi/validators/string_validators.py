@@ -1,5 +1,4 @@
-import re
-from typing import Any, Union
+from typing import Any, Pattern, Union
 
 from opyapi.errors import (
     FormatValidationError,
@@ -8,19 +7,26 @@ from opyapi.errors import (
     TypeValidationError,
 )
 from opyapi.string_format import StringFormat
+from opyapi.validators._regex import compile_pattern
 
 
 def validate_string(
-    value: Any, minimum_length: int = -1, maximum_length: int = -1, pattern: str = "", format_name: str = ""
+    value: Any,
+    minimum_length: int = -1,
+    maximum_length: int = -1,
+    pattern: Union[str, Pattern] = "",
+    format_name: str = "",
 ) -> Union[str, Any]:
-    if not isinstance(value, str):
+    if type(value) is not str and not isinstance(value, str):
         raise TypeValidationError(value=value, expected_type=str, actual_type=type(value))
 
-    if minimum_length > -1:
-        validate_minimum_length(value, minimum_length)
-
-    if maximum_length > -1:
-        validate_maximum_length(value, maximum_length)
+    # length checks are inlined, the standalone helpers re-validate the type of passed value
+    if minimum_length > -1 or maximum_length > -1:
+        length = len(value)
+        if length < minimum_length:
+            raise MinimumItemsValidationError(expected_minimum=minimum_length)
+        if -1 < maximum_length < length:
+            raise MaximumItemsValidationError(expected_maximum=maximum_length)
 
     if pattern:
         validate_string_pattern(value, pattern)
@@ -46,14 +52,23 @@ def validate_maximum_length(value: str, expected_maximum: int) -> str:
     raise MaximumItemsValidationError(expected_maximum=expected_maximum)
 
 
-def validate_string_pattern(value: str, pattern: str) -> str:
-    if not re.search(pattern, value):
-        raise FormatValidationError(expected_format=pattern)
+def validate_string_pattern(value: str, pattern: Union[str, Pattern]) -> str:
+    if isinstance(pattern, str):
+        pattern = compile_pattern(pattern)
+
+    if not pattern.search(value):
+        raise FormatValidationError(expected_format=pattern.pattern)
 
     return value
 
 
 def validate_string_format(value: str, format_name: str) -> Any:
+    pattern = StringFormat.regex_formats.get(format_name)
+    if pattern is not None:
+        if not pattern.match(value):
+            raise FormatValidationError(expected_format=format_name)
+        return value
+
     format_validator = StringFormat[format_name]
 
     return format_validator(value)
@@ -1,4 +1,6 @@
+from importlib.util import module_from_spec, spec_from_file_location
 from os import path
+from pathlib import Path
 
 import pytest
 from cleo.application import Application
@@ -31,16 +33,19 @@ def test_fail_command_invalid_output_module() -> None:
     assert command_tester.io.fetch_error() == "Output module `dto.py` does not exists.\n"
 
 
-def test_generate_dtos() -> None:
+def test_generate_dtos(tmp_path: Path) -> None:
     command_tester = get_command_tester(GenerateDtoCommand(), "generate:dto")
     openapi_path = path.dirname(__file__) + "/../fixtures/openapi.yml"
-    dto_module = path.dirname(__file__) + "/../fixtures/generated_dtos.py"
+    dto_module = tmp_path / "generated_dtos.py"
+    dto_module.touch()  # generated module is written to a temporary file, so test runs do not modify the tree
     result = command_tester.execute(f"{openapi_path} --module-path={dto_module}")
 
     assert not result
 
     try:
-        from tests.fixtures import generated_dtos
+        spec = spec_from_file_location("generated_dtos", dto_module)
+        generated_dtos = module_from_spec(spec)  # type: ignore
+        spec.loader.exec_module(generated_dtos)  # type: ignore
     except Exception:
         pytest.fail("Failed to generate valid dto classes")
         return
@@ -0,0 +1,160 @@
+from typing import Any
+
+import pytest
+
+from opyapi import RegexFormat, StringFormat, build_validator_for
+from opyapi.codegen import compile_schema
+from opyapi.errors import (
+    AdditionalPropertiesValidationError,
+    EnumValidationError,
+    FormatValidationError,
+    MaximumItemsValidationError,
+    MinimumItemsValidationError,
+    PropertyValueValidationError,
+    RequiredPropertyValidationError,
+    TypeValidationError,
+    UniqueItemsValidationError,
+)
+
+ADDRESS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "number": {"type": "integer", "minimum": 1},
+        "street_name": {"type": "string", "minLength": 2, "pattern": "^[A-Z]"},
+        "street_type": {"enum": ["Street", "Avenue", "Boulevard"]},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["street_name"],
+    "additionalProperties": False,
+}
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"street_name": "Pennsylvania"},
+        {"number": 1600, "street_name": "Pennsylvania", "street_type": "Avenue"},
+        {"street_name": "Pennsylvania", "tags": ["white", "house"]},
+    ],
+)
+def test_pass_compiled_schema(value: Any) -> None:
+    # given
+    validate = compile_schema(ADDRESS_SCHEMA)
+
+    # then
+    assert validate(value) == build_validator_for(ADDRESS_SCHEMA)(value)
+
+
+@pytest.mark.parametrize(
+    "value, error",
+    [
+        [{"number": 1600}, RequiredPropertyValidationError],
+        [{"street_name": "Pennsylvania", "number": 0}, PropertyValueValidationError],
+        [{"street_name": "Pennsylvania", "number": True}, PropertyValueValidationError],
+        [{"street_name": "pennsylvania"}, PropertyValueValidationError],
+        [{"street_name": "Pennsylvania", "street_type": "Road"}, PropertyValueValidationError],
+        [{"street_name": "Pennsylvania", "tags": [1]}, PropertyValueValidationError],
+        [{"street_name": "Pennsylvania", "zip": "20500"}, AdditionalPropertiesValidationError],
+    ],
+)
+def test_fail_compiled_schema(value: Any, error: type) -> None:
+    # given
+    validate = compile_schema(ADDRESS_SCHEMA)
+
+    # then
+    with pytest.raises(error):
+        validate(value)
+
+
+def test_compiled_enum_distinguishes_booleans() -> None:
+    # given
+    validate = compile_schema({"enum": [1, "true"]})
+
+    # then
+    assert validate(1) == 1
+    with pytest.raises(EnumValidationError):
+        validate(True)
+    with pytest.raises(EnumValidationError):
+        validate([1])
+
+
+def test_equal_schemas_are_compiled_separately() -> None:
+    assert compile_schema({"type": "string"}) is not compile_schema({"type": "string"})
+
+
+def test_closed_object_schemas_are_compiled() -> None:
+    # given
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}, "additionalProperties": False}
+
+    # when
+    validate = build_validator_for(schema)
+
+    # then
+    assert validate.__code__.co_filename == "<opyapi:schema>"
+    assert validate({"name": "Bob"}) == {"name": "Bob"}
+    with pytest.raises(AdditionalPropertiesValidationError):
+        validate({"name": "Bob", "age": 12})
+
+
+def test_compiled_object_reports_missing_required_property() -> None:
+    # given
+    validate = compile_schema({"type": "object", "required": ["name", "email"]})
+
+    # when
+    with pytest.raises(RequiredPropertyValidationError) as error:
+        validate({"name": "Bob"})
+
+    # then
+    assert error.value.context["property_name"] == "email"
+
+
+def test_compiled_string_uses_regex_formats() -> None:
+    # given
+    StringFormat["compiled-postal-code"] = RegexFormat(r"^[0-9]{5}$")
+    validate = compile_schema({"type": "string", "format": "compiled-postal-code"})
+
+    # then
+    assert validate("20500") == "20500"
+    with pytest.raises(FormatValidationError) as error:
+        validate("K1M 1M4")
+    assert error.value.context["expected_format"] == "compiled-postal-code"
+
+
+def test_open_object_schemas_are_compiled() -> None:
+    # given
+    schema = {
+        "type": "object",
+        "properties": {"name": {"type": "string"}},
+        "additionalProperties": {"type": "integer"},
+    }
+
+    # when
+    validate = build_validator_for(schema)
+
+    # then
+    assert validate.__code__.co_filename == "<opyapi:schema>"
+    assert validate({"name": "Bob", "age": 12}) == {"name": "Bob", "age": 12}
+    with pytest.raises(PropertyValueValidationError):
+        validate({"name": "Bob", "age": "12"})
+
+
+ARRAY_SCHEMA = {"type": "array", "items": {"type": "integer"}, "minItems": 1, "maxItems": 3, "uniqueItems": True}
+
+
+def test_pass_compiled_array_schema() -> None:
+    assert compile_schema(ARRAY_SCHEMA)([1, 2]) == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "value, error",
+    [
+        [[], MinimumItemsValidationError],
+        [[1, 2, 3, 4], MaximumItemsValidationError],
+        [[1, 1], UniqueItemsValidationError],
+        [["1"], TypeValidationError],
+        [{}, TypeValidationError],
+    ],
+)
+def test_fail_compiled_array_schema(value: Any, error: type) -> None:
+    with pytest.raises(error):
+        compile_schema(ARRAY_SCHEMA)(value)
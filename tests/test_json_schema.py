@@ -1,10 +1,13 @@
-import cProfile
-import time
+import json
+from datetime import date
 from os import path
+from pathlib import Path
+from typing import Any, Iterator
 
 from opyapi import build_validator_for
-from opyapi.json_schema import JsonSchema, JsonSchemaStore
-import yaml
+from opyapi._yaml_support import load_yaml
+from opyapi.json_schema import FileLoader, JsonSchema, JsonSchemaStore, JsonUri
+import pytest
 
 
 def test_can_instantiate_schema() -> None:
@@ -59,12 +62,32 @@ def test_can_dump_schema() -> None:
     }
 
 
-def test_can_build_validator_for_complex_schema() -> None:
+@pytest.fixture
+def cached_file_loader(tmp_path_factory: Any) -> Iterator[FileLoader]:
+    # parsed fixtures are cached in a temporary directory, so tests never write next to tracked files
+    default_loader = JsonSchemaStore.loaders["file"]
+    loader = FileLoader(cache=True, cache_dir=str(tmp_path_factory.mktemp("opyapi")))
+    JsonSchemaStore.add_loader(loader, "file")
+    yield loader
+    JsonSchemaStore.add_loader(default_loader, "file")
+
+
+def test_local_schemas_are_not_kept_in_store() -> None:
+    # given
+    schema = JsonSchema({"type": "string"})
+
+    # then
+    assert schema.document == {"type": "string"}
+    assert not JsonSchemaStore.has(schema.id)
+
+
+def test_can_build_validator_for_complex_schema(cached_file_loader: FileLoader) -> None:
     openapi_schema = path.join(path.dirname(__file__), "fixtures/openapi_schema.yml")
     test_file = path.join(path.dirname(__file__), "fixtures/openapi.yml")
     schema = JsonSchema.from_file(openapi_schema)
     validate = build_validator_for(schema)
-    validate(yaml.full_load(open(test_file)))
+    with open(test_file, "rb") as file:
+        validate(load_yaml(file))
 
 
 def test_can_resolve_complex_refs() -> None:
@@ -151,4 +174,183 @@ def test_dynamic_refs() -> None:
 
 
 def test_anchors() -> None:
-    pass
+    # given
+    schema = JsonSchema(
+        {
+            "$defs": {"name": {"$anchor": "name", "type": "string"}},
+            "properties": {"name": {"$ref": "#name"}},
+        }
+    )
+
+    # then
+    assert schema.query("#name") == {"type": "string"}
+    assert schema["properties"]["name"].document == {"type": "string"}
+    assert schema.anchors == {"#name": ("$defs", "name")}
+
+
+def test_can_query_pointer_with_escaped_slash() -> None:
+    # given
+    schema = JsonSchema({"paths": {"/pets": {"get": {"type": "string"}}}, "list": [{"type": "integer"}]})
+
+    # then
+    assert schema.query("#/paths/\\/pets/get") == {"type": "string"}
+    assert schema.query("#/list/0") == {"type": "integer"}
+
+
+def test_can_query_pointer_with_rfc_6901_escapes() -> None:
+    # given
+    schema = JsonSchema({"paths": {"/pets": {"get": {"type": "string"}}, "a~b": {"type": "integer"}}})
+
+    # then
+    assert schema.query("#/paths/~1pets/get") == {"type": "string"}
+    assert schema.query("#/paths/a~0b") == {"type": "integer"}
+
+
+def test_can_resolve_shared_sub_documents() -> None:
+    # given
+    shared = {"$ref": "#/$defs/name"}
+    schema = JsonSchema(
+        {"properties": {"first_name": shared, "last_name": shared}, "$defs": {"name": {"type": "string"}}}
+    )
+
+    # when
+    schema_dump = schema.dump()
+
+    # then
+    assert schema_dump["properties"] == {"first_name": {"type": "string"}, "last_name": {"type": "string"}}
+
+
+def test_file_loader_can_cache_parsed_documents(tmp_path: Path) -> None:
+    # given
+    schema_file = tmp_path / "schema.yml"
+    schema_file.write_text("type: string\n")
+    cache_dir = tmp_path / "cache"
+    loader = FileLoader(cache=True, cache_dir=str(cache_dir))
+
+    # when
+    document = loader.load(JsonUri(f"file://{schema_file}"))
+
+    # then
+    assert document == {"type": "string"}
+    assert [cache_file.suffix for cache_file in cache_dir.iterdir()] == [".json"]
+    assert sorted(tmp_path.iterdir()) == [cache_dir, schema_file]
+    cached_loader = FileLoader(cache=True, cache_dir=str(cache_dir))
+    assert cached_loader.load(JsonUri(f"file://{schema_file}")) == {"type": "string"}
+
+
+@pytest.mark.parametrize("value", [18446744073709551617, -9223372036854775809, 18446744073709551615])
+def test_can_load_json_files_with_long_integers(tmp_path: Path, value: int) -> None:
+    # given
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(f'{{"type": "integer", "maximum": {value}}}')
+
+    # when
+    validate = build_validator_for(JsonSchema.from_file(str(schema_file)))
+
+    # then
+    assert validate(value) == value
+    with pytest.raises(ValueError):
+        validate(value + 1)
+
+
+@pytest.mark.parametrize("content", ['{"a": NaN}', '{"a": Infinity}', '{"a": 1e400}', '{"a": "\\ud800"}'])
+def test_can_load_json_files_with_non_standard_literals(tmp_path: Path, content: str) -> None:
+    # given
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(content)
+
+    # when
+    document = FileLoader().load(JsonUri(f"file://{schema_file}"))
+
+    # then
+    assert repr(document) == repr(json.loads(content))
+
+
+def test_file_loader_does_not_cache_documents_without_json_form(tmp_path: Path) -> None:
+    # given
+    schema_file = tmp_path / "schema.yml"
+    schema_file.write_text("const: 2021-11-10\n")
+    cache_dir = tmp_path / "cache"
+
+    # when
+    document = FileLoader(cache=True, cache_dir=str(cache_dir)).load(JsonUri(f"file://{schema_file}"))
+
+    # then
+    assert document == {"const": date(2021, 11, 10)}
+    assert not cache_dir.exists()
+
+
+def test_can_clear_schema_store() -> None:
+    # given
+    filename = path.join(path.dirname(__file__), "fixtures/pet.yml")
+    schema = JsonSchema.from_file(filename)
+    assert JsonSchemaStore.has(schema.id)
+
+    # when
+    JsonSchemaStore.clear()
+
+    # then
+    assert not JsonSchemaStore.has(schema.id)
+    assert JsonSchema.from_file(filename) is not schema
+
+
+def test_can_resolve_reference_chains() -> None:
+    # given
+    schema = JsonSchema(
+        {
+            "$defs": {
+                "a": {"$ref": "#/$defs/b", "description": "a"},
+                "b": {"$ref": "#/$defs/c"},
+                "c": {"type": "string"},
+                "cycle": {"$ref": "#/$defs/cycle"},
+            },
+        }
+    )
+
+    # then
+    assert schema["$defs"]["a"].document == {"description": "a", "type": "string"}
+    with pytest.raises(RecursionError):
+        schema["$defs"]["cycle"].document
+
+
+def test_shares_references_without_sibling_keywords() -> None:
+    # given
+    schema = JsonSchema(
+        {
+            "properties": {
+                "a": {"$ref": "#/$defs/item"},
+                "b": {"$ref": "#/$defs/item"},
+                "c": {"$ref": "#/$defs/item", "description": "c"},
+            },
+            "$defs": {"item": {"type": "string"}},
+        }
+    )
+    properties = schema["properties"]
+
+    # then
+    assert properties["a"] is properties["b"]
+    assert properties["c"] is not properties["a"]
+    assert properties["c"].document == {"type": "string", "description": "c"}
+
+
+def test_can_load_deeply_nested_documents() -> None:
+    # given
+    document: dict = {"type": "string"}
+    for _ in range(5000):
+        document = {"items": document}
+    document["$defs"] = {"leaf": {"$ref": "#/items" + "/items" * 4999}}
+
+    # when
+    schema = JsonSchema(document)
+
+    # then
+    assert schema["$defs"]["leaf"].document == {"type": "string"}
+
+
+def test_can_iterate_reference() -> None:
+    # given
+    schema = JsonSchema({"$defs": {"item": {"type": "string", "minLength": 1}}, "items": {"$ref": "#/$defs/item"}})
+
+    # then
+    assert list(schema["items"]) == ["type", "minLength"]
+    assert dict(schema["items"]) == {"type": "string", "minLength": 1}
@@ -15,6 +15,7 @@ def test_can_instantiate() -> None:
     [
         ["../schema.json", "domain://root/schema.json"],
         ["../../schema.json", "domain://schema.json"],
+        ["./other.json#/definitions", "domain://root/child/other.json#/definitions"],
     ],
 )
 def test_add_to_uri(given: str, expected: str) -> None:
@@ -27,3 +28,29 @@ def test_add_to_uri(given: str, expected: str) -> None:
     # then
     assert str(result) == expected
     assert result != uri
+
+
+def test_can_share_instances_created_from_string() -> None:
+    # given
+    uri = JsonUri.from_str("scheme://test/test.json#/fragment")
+
+    # then
+    assert JsonUri.from_str("scheme://test/test.json#/fragment") is uri
+    assert str(uri) == "scheme://test/test.json#/fragment"
+
+
+def test_fail_to_instantiate_invalid_uri() -> None:
+    with pytest.raises(ValueError):
+        JsonUri("invalid")
+
+
+@pytest.mark.parametrize(
+    "base, given, expected",
+    [
+        ["domain://root/a.b", "c.json", "domain://root/c.json"],
+        ["domain://root/dir", "c.json", "domain://root/dir/c.json"],
+        ["domain://a", "c.json", "domain://a/c.json"],
+    ],
+)
+def test_add_to_uri_with_short_path_items(base: str, given: str, expected: str) -> None:
+    assert str(JsonUri(base) + given) == expected
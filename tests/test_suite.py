@@ -1,8 +1,12 @@
+import json
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+from typing import Any, Callable, Dict, List, Set, Tuple
 
 import pytest
 from opyapi import build_validator_for, JsonSchema
-import json
+from opyapi._json_support import loads_json
 
 
 schema_test_suits = pathlib.Path(__file__).parent / "test_cases" / "tests"
@@ -38,10 +42,39 @@ SKIP_TESTS = [
     "draft-7 / items.json / items and subitems / wrong sub-item*",
 ]
 
+# sections share their schema between tests, so each schema is compiled once per session
+_VALIDATOR_CACHE: Dict[int, Callable] = {}
+
+
+def _index_skip_patterns(patterns: List[str]) -> Tuple[Set[Tuple[str, ...]], Dict[Tuple[str, ...], Tuple[str, ...]]]:
+    """
+    Splits skip patterns into `(version, file, section, test)` keys of exact patterns and
+    prefixes of prefix patterns, grouped by the segments preceding the matched description.
+    """
+    exact: Set[Tuple[str, ...]] = set()
+    prefixes: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+    for pattern in patterns:
+        parts = tuple(pattern.split(" / "))
+        if not pattern.endswith("*"):
+            exact.add(parts)
+            continue
+        prefixes[parts[:-1]] = prefixes.get(parts[:-1], ()) + (parts[-1][0:-1].rstrip(),)
+
+    return exact, prefixes
+
+
+# skip patterns are indexed once, tests are matched by tuple keys without building normalized ids
+_SKIP_EXACT, _SKIP_PREFIXES = _index_skip_patterns(SKIP_TESTS)
+
+
+def _load_suite(suite: pathlib.Path) -> Tuple[pathlib.Path, List[dict]]:
+    return suite, loads_json(suite.read_bytes())
+
 
 def pytest_generate_tests(metafunc):
     parameters = []
     test_ids = []
+    canonical_schemas: Dict[str, Any] = {}
 
     schema_suits = {
         "draft-7": schema_test_suits / "draft7",
@@ -50,33 +83,47 @@ def pytest_generate_tests(metafunc):
     for version, base_path in schema_suits.items():
         tests_files = sorted(base_path.glob("*.json"))
 
-        for suite in tests_files:
-            tests = json.load(open(suite))
-            for section in tests:
-                for test in section["tests"]:
-                    test_id = f"{version} / {suite.name} / {section['description']} / {test['description']}"
-                    skip = False
-                    for pattern in SKIP_TESTS:
-                        if not pattern.endswith("*"):
-                            if test_id.replace(" ", "") == pattern.replace(" ", ""):
-                                skip = True
-                        else:
-                            if test_id.replace(" ", "").startswith(pattern.replace(" ", "")[0:-1]):
-                                skip = True
-                    if skip:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # suites are collected as soon as they are parsed, while the remaining files are still loading
+            for suite, tests in executor.map(_load_suite, tests_files):
+                section_prefixes = _SKIP_PREFIXES.get((version, suite.name), ())
+                for section in tests:
+                    if section["description"].startswith(section_prefixes):
                         continue
-                    parameters.append(pytest.param(section["schema"], test["data"], test["valid"]))
-                    test_ids.append(test_id)
-
-    metafunc.parametrize(("schema", "data", "valid"), parameters, ids=test_ids)
-
-
-def test_json_schema_suite(schema, data, valid):
-    json_schema = JsonSchema(schema)
-    json_schema_validator = build_validator_for(json_schema)
-
+                    test_prefixes = _SKIP_PREFIXES.get((version, suite.name, section["description"]), ())
+                    # structurally equal schemas share one object, so they also share one compiled validator
+                    schema_key = json.dumps(section["schema"], sort_keys=True)
+                    schema = canonical_schemas.setdefault(schema_key, section["schema"])
+                    # with `pytest -n auto --dist loadgroup` tests sharing a schema run on the same worker
+                    schema_group = pytest.mark.xdist_group(
+                        name="schema-" + blake2b(schema_key.encode(), digest_size=8).hexdigest()
+                    )
+                    for test in section["tests"]:
+                        if test["description"].startswith(test_prefixes) or (
+                            (version, suite.name, section["description"], test["description"]) in _SKIP_EXACT
+                        ):
+                            continue
+                        test_id = f"{version} / {suite.name} / {section['description']} / {test['description']}"
+                        parameters.append(pytest.param(schema, test["data"], test["valid"], marks=schema_group))
+                        test_ids.append(test_id)
+
+    metafunc.parametrize(("validator", "data", "valid"), parameters, ids=test_ids, indirect=["validator"])
+
+
+@pytest.fixture(scope="session")
+def validator(request) -> Callable:
+    schema = request.param
+    json_schema_validator = _VALIDATOR_CACHE.get(id(schema))
+    if json_schema_validator is None:
+        json_schema_validator = build_validator_for(JsonSchema(schema))
+        _VALIDATOR_CACHE[id(schema)] = json_schema_validator
+
+    return json_schema_validator
+
+
+def test_json_schema_suite(validator, data, valid):
     try:
-        json_schema_validator(data)
+        validator(data)
         result = True
     except ValueError:
         result = False
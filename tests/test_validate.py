@@ -0,0 +1,157 @@
+from typing import Any, Callable, List
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+import opyapi
+from opyapi import build_validator_for, is_valid, memoized_validator, validate
+
+
+def test_can_validate_against_dict_schema() -> None:
+    # given
+    schema = {"type": "object", "properties": {"id": {"$ref": "#/$defs/id"}}, "$defs": {"id": {"type": "integer"}}}
+
+    # then
+    assert validate({"id": 1}, schema)
+    assert validate({"id": 2}, schema)
+    with pytest.raises(ValueError):
+        validate({"id": "1"}, schema)
+    assert "$ref" in schema["properties"]["id"]
+
+
+def test_can_validate_without_copying_schema() -> None:
+    # given
+    schema = {"type": "string", "minLength": 2}
+
+    # then
+    assert validate("ab", schema, copy=False)
+    with pytest.raises(ValueError):
+        validate("a", schema, copy=False)
+
+
+def test_can_reuse_built_validator() -> None:
+    # given
+    schema = {"type": "integer"}
+    validator = build_validator_for(schema)
+
+    # then
+    assert build_validator_for(schema) is validator
+    assert build_validator_for({"type": "integer"}) is not validator
+
+    build_validator_for.cache_clear()  # type: ignore
+    assert build_validator_for(schema) is not validator
+
+
+def test_validate_builds_validator_once(monkeypatch: MonkeyPatch) -> None:
+    # given
+    schema = {"type": "integer", "maximum": 5}
+    built: List[Any] = []
+    build = opyapi._build_validator_for
+
+    def _build(any_schema: Any) -> Callable:
+        built.append(any_schema)
+        return build(any_schema)
+
+    monkeypatch.setattr(opyapi, "_build_validator_for", _build)
+
+    # when
+    validate(1, schema)
+    validate(2, schema)
+
+    # then
+    assert len(built) == 1
+
+
+def test_mutated_schema_requires_clearing_validator_cache() -> None:
+    # given
+    schema = {"type": "integer", "minimum": 5}
+    build_validator_for(schema)
+
+    # when
+    schema["minimum"] = 10
+
+    # then
+    assert build_validator_for(schema)(6) == 6
+
+    # when
+    build_validator_for.cache_clear()  # type: ignore
+
+    # then
+    with pytest.raises(ValueError):
+        build_validator_for(schema)(6)
+
+
+def test_can_validate_against_root_reference() -> None:
+    # given
+    schema = {"$defs": {"id": {"type": "integer"}}, "$ref": "#/$defs/id"}
+
+    # then
+    assert validate(1, schema) == 1
+    with pytest.raises(ValueError):
+        validate("1", schema)
+
+
+def test_fail_build_validator_for_unresolved_reference() -> None:
+    with pytest.raises(ValueError):
+        build_validator_for({"$defs": {"id": {"type": "integer"}}, "$ref": "#/$defs/id"})
+
+
+def test_can_validate_against_annotations_only_schema() -> None:
+    assert validate({"any": "value"}, {"description": "Accepts anything"}) == {"any": "value"}
+
+
+def test_can_memoize_validator() -> None:
+    # given
+    calls = []
+
+    @memoized_validator(maxsize=1)
+    def validator(value: Any) -> Any:
+        calls.append(value)
+        return build_validator_for({"type": "object", "required": ["id"]})(value)
+
+    # when
+    validator({"id": 1, "name": "Bob"})
+    validator({"name": "Bob", "id": 1})
+
+    # then
+    assert len(calls) == 1
+
+    # when
+    validator({"id": 2})
+    validator({"id": 1, "name": "Bob"})
+
+    # then
+    assert len(calls) == 3
+
+
+def test_memoized_validator_does_not_memoize_failures() -> None:
+    # given
+    validator = memoized_validator(build_validator_for({"type": "object", "required": ["id"]}))
+
+    # then
+    with pytest.raises(ValueError):
+        validator({"name": "Bob"})
+    with pytest.raises(ValueError):
+        validator({"name": "Bob"})
+
+
+def test_memoized_validator_keys_values_by_type() -> None:
+    # given
+    validator = memoized_validator(build_validator_for({"type": "array"}))
+
+    # when
+    validator([1, 2])
+
+    # then
+    with pytest.raises(ValueError):
+        validator((1, 2))
+
+
+def test_can_check_if_value_is_valid() -> None:
+    # given
+    schema = {"type": "object", "required": ["id"]}
+
+    # then
+    assert is_valid({"id": 1}, schema)
+    assert not is_valid({"name": "Bob"}, schema)
+    assert not is_valid("Bob", schema)
@@ -4,6 +4,9 @@ from opyapi import build_validator_for
 from opyapi.errors import (
     MaximumItemsValidationError,
     MinimumItemsValidationError,
+    MinimumValidationError,
+    MultipleOfValidationError,
+    TypeValidationError,
     UniqueItemsValidationError,
 )
 from opyapi.validators import (
@@ -212,3 +215,85 @@ def test_unique_array_with_multiple_items_definition() -> None:
     # then
     with pytest.raises(ValueError):
         validate(data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [[1], [True]],
+        [{"a": 0}, {"a": False}],
+        [{"a": [1, {"b": None}]}, {"a": [1, {"b": False}]}],
+        [{1, 2}, {1, 3}],
+        [[{1}, True], [{1}, 1]],
+        [{"a": {1}, "b": [True]}, {"a": {1}, "b": [1]}],
+    ],
+)
+def test_pass_validate_unique_nested_items(data: list) -> None:
+    assert validate_array(data, unique_items=True) == data
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [[1, {"a": True}], [1.0, {"a": True}]],
+        [{"a": 1, "b": 2}, {"b": 2, "a": 1}],
+        [{1, 2}, {2, 1}],
+        [[{1}, 1], [{1}, 1.0]],
+        [{"a": {1}, "b": [False]}, {"b": [False], "a": {1}}],
+    ],
+)
+def test_fail_validate_unique_nested_items(data: list) -> None:
+    with pytest.raises(UniqueItemsValidationError):
+        validate_array(data, unique_items=True)
+
+
+def test_validate_array_tuple_does_not_modify_value() -> None:
+    # given
+    validate = build_validator_for(
+        {"type": "array", "items": [{"type": "number"}], "additionalItems": {"type": "string"}}
+    )
+    value = [1600, "Pennsylvania"]
+
+    # when
+    result = validate(value)
+
+    # then
+    assert result == value
+    assert result is not value
+
+
+# parametrized cases below share one compiled validator
+INTEGER_ARRAY_VALIDATOR = build_validator_for(
+    {"type": "array", "items": {"type": "integer", "minimum": 0, "multipleOf": 5}}
+)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        [0, 5, 10],
+        [10] * 100,
+    ],
+)
+def test_pass_validate_integer_array(data: list) -> None:
+    # when
+    result = INTEGER_ARRAY_VALIDATOR(data)
+
+    # then
+    assert result == data
+    assert result is not data
+
+
+@pytest.mark.parametrize(
+    "data, error",
+    [
+        [[0, True], TypeValidationError],
+        [[0, 5.0], TypeValidationError],
+        [[0, -5], MinimumValidationError],
+        [[0, 6], MultipleOfValidationError],
+    ],
+)
+def test_fail_validate_integer_array(data: list, error: type) -> None:
+    with pytest.raises(error):
+        INTEGER_ARRAY_VALIDATOR(data)
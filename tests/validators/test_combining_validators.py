@@ -1,6 +1,7 @@
 import pytest
 
 from opyapi import build_validator_for
+from opyapi.errors import ValidationError
 
 
 def test_validate_if_then_validator() -> None:
@@ -79,6 +80,27 @@ def test_if_then_else_validator() -> None:
         validate({"name": 100})
 
 
+def test_object_if_then_else_validator() -> None:
+    # given
+    validate = build_validator_for(
+        {
+            "type": "object",
+            "properties": {
+                "country": {"default": "United States of America", "enum": ["United States of America", "Canada"]},
+            },
+            "if": {"properties": {"country": {"const": "United States of America"}}},
+            "then": {"properties": {"postal_code": {"pattern": "[0-9]{5}(-[0-9]{4})?"}}},
+            "else": {"properties": {"postal_code": {"pattern": "[A-Z][0-9][A-Z] [0-9][A-Z][0-9]"}}},
+        }
+    )
+
+    # then
+    assert validate({"country": "United States of America", "postal_code": "20500"})
+    assert validate({"country": "Canada", "postal_code": "K1M 1M4"})
+    with pytest.raises(ValueError):
+        validate({"country": "Canada", "postal_code": "10000"})
+
+
 def test_all_of() -> None:
     # given
     validate = build_validator_for(
@@ -117,47 +139,64 @@ def test_all_of() -> None:
         )
 
 
-def test_all_of_if_then() -> None:
-    # given
-    validate = build_validator_for(
+ALL_OF_IF_THEN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "country": {
+            "type": "string",
+        },
+        "street_address": {
+            "type": "string",
+        },
+    },
+    "required": ["street_address", "country"],
+    "allOf": [
         {
-            "type": "object",
-            "properties": {
-                "country": {
-                    "type": "string",
-                },
-                "street_address": {
-                    "type": "string",
-                },
+            "if": {"properties": {"country": {"const": "United States of America"}}},
+            "then": {"properties": {"postal_code": {"pattern": "[0-9]{5}(-[0-9]{4})?"}}},
+        },
+        {
+            "if": {
+                "properties": {"country": {"const": "Canada"}},
+                "required": ["country"],
             },
-            "required": ["street_address", "country"],
-            "allOf": [
-                {
-                    "if": {"properties": {"country": {"const": "United States of America"}}},
-                    "then": {"properties": {"postal_code": {"pattern": "[0-9]{5}(-[0-9]{4})?"}}},
-                },
-                {
-                    "if": {
-                        "properties": {"country": {"const": "Canada"}},
-                        "required": ["country"],
-                    },
-                    "then": {"properties": {"postal_code": {"pattern": "[A-Z][0-9][A-Z] [0-9][A-Z][0-9]"}}},
-                },
-                {
-                    "if": {
-                        "properties": {"country": {"const": "Netherlands"}},
-                        "required": ["country"],
-                    },
-                    "then": {"properties": {"postal_code": {"pattern": "[0-9]{4} [A-Z]{2}"}}},
-                },
-            ],
-        }
-    )
-
-    # then
-
+            "then": {"properties": {"postal_code": {"pattern": "[A-Z][0-9][A-Z] [0-9][A-Z][0-9]"}}},
+        },
+        {
+            "if": {
+                "properties": {"country": {"const": "Netherlands"}},
+                "required": ["country"],
+            },
+            "then": {"properties": {"postal_code": {"pattern": "[0-9]{4} [A-Z]{2}"}}},
+        },
+    ],
+}
+ALL_OF_IF_THEN_VALIDATOR = build_validator_for(ALL_OF_IF_THEN_SCHEMA)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"street_address": "1600 Pennsylvania Avenue", "country": "United States of America", "postal_code": "20500"},
+        {"street_address": "24 Sussex Drive", "country": "Canada", "postal_code": "K1M 1M4"},
+        {"street_address": "Adriaan Goekooplaan", "country": "Netherlands", "postal_code": "2517 JX"},
+    ],
+)
+def test_pass_all_of_if_then(value: dict) -> None:
+    assert ALL_OF_IF_THEN_VALIDATOR(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"country": "United States of America", "postal_code": "20500"},
+        {"street_address": "24 Sussex Drive", "country": "Canada", "postal_code": "10000"},
+        {"street_address": "Adriaan Goekooplaan", "country": "Netherlands", "postal_code": "K1M 1M4"},
+    ],
+)
+def test_fail_all_of_if_then(value: dict) -> None:
     with pytest.raises(ValueError):
-        validate({"country": "United States of America", "postal_code": "20500"})
+        ALL_OF_IF_THEN_VALIDATOR(value)
 
 
 def test_validate_all_of() -> None:
@@ -273,3 +312,16 @@ def test_all_of_bool_values() -> None:
     # then
     with pytest.raises(ValueError):
         validate(data)
+
+
+def test_validate_any_of_error_message() -> None:
+    # given
+    validate = build_validator_for({"anyOf": [{"type": "string"}, {"type": "number"}]})
+
+    # when
+    with pytest.raises(ValidationError) as error:
+        validate([1, 2])
+
+    # then
+    assert error.value.code == "any_error"
+    assert str(error.value) == "Value could not be validated: [1, 2]"
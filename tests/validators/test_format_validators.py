@@ -1,4 +1,6 @@
 from base64 import b64encode
+from decimal import Decimal
+from typing import Any
 
 import pytest
 
@@ -96,6 +98,11 @@ def test_pass_valid_format(given_string: str, given_format: str) -> None:
         ["invalid", StringFormat.DATE_TIME],
         ["invalid", StringFormat.DECIMAL],
         ["invalid", StringFormat.EMAIL],
+        ["@example.com", StringFormat.EMAIL],
+        ["email@@example.com", StringFormat.EMAIL],
+        ["email name@example.com", StringFormat.EMAIL],
+        ["email..name@example.com", StringFormat.EMAIL],
+        ["email@-example.com", StringFormat.EMAIL],
         ["__invalid", StringFormat.HOSTNAME],
         ["invalid", StringFormat.IP_ADDRESS],
         ["invalid", StringFormat.IP_ADDRESS_V4],
@@ -112,3 +119,30 @@ def test_pass_valid_format(given_string: str, given_format: str) -> None:
 def test_fail_invalid_format(given_string: str, given_format: str) -> None:
     with pytest.raises(FormatValidationError):
         validate_string_format(given_string, given_format)
+
+
+@pytest.mark.parametrize("given_value", [1.0, 0.0, [1], "maybe"])
+def test_fail_boolean_format_for_non_boolean_expressions(given_value: Any) -> None:
+    with pytest.raises(FormatValidationError):
+        validate_string_format(given_value, StringFormat.BOOLEAN)
+
+
+@pytest.mark.parametrize("given_value", ["12.1234", Decimal("12.1234")])
+def test_decimal_format_returns_string(given_value: Any) -> None:
+    # when
+    result = validate_string_format(given_value, StringFormat.DECIMAL)
+
+    # then
+    assert result == "12.1234"
+
+
+@pytest.mark.parametrize("given_value", ["NaN", "Infinity", Decimal("NaN"), Decimal("-Infinity")])
+def test_fail_decimal_format_for_non_finite_values(given_value: Any) -> None:
+    with pytest.raises(FormatValidationError):
+        validate_string_format(given_value, StringFormat.DECIMAL)
+
+
+def test_fail_url_format_for_long_invalid_host() -> None:
+    # nested quantifiers in the url pattern used to backtrack exponentially on this input
+    with pytest.raises(FormatValidationError):
+        validate_string_format("http://" + "a" * 64 + "!", StringFormat.URL)
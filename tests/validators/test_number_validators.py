@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Union
+from typing import Any, Union
 
 import pytest
 
@@ -127,6 +127,8 @@ def test_fail_validate_exclusive_minimum(value: int, expected_minimum: int) -> N
         [2, 2],
         [2, 1],
         [9, 3],
+        [-9, 3],
+        [10**30, 10**15],
         [Decimal("4"), Decimal("2")],
         [Decimal("4"), 2],
         [4.0, 2],
@@ -143,6 +145,8 @@ def test_pass_validate_multiple_of(value: Union[int, float, Decimal], multiple_o
         [2, 3],
         [2, 1.2],
         [9, 4],
+        [-9, 4],
+        [10**30 + 1, 10**15],
         [Decimal("4"), Decimal("3")],
         [Decimal("3"), 2],
         [3.0, 2],
@@ -210,3 +214,22 @@ def test_number_validator_minimum_maximum() -> None:
         validate(1)
     with pytest.raises(RangeValidationError):
         validate(6)
+
+
+@pytest.mark.parametrize(
+    "value, expected_error",
+    [
+        [1, MinimumValidationError],
+        [6, MaximumValidationError],
+        [3.0, TypeValidationError],
+        [True, TypeValidationError],
+        ["3", TypeValidationError],
+    ],
+)
+def test_fail_integer_range_validator(value: Any, expected_error: type) -> None:
+    # given
+    validate = build_validator_for({"type": "integer", "minimum": 2, "maximum": 5})
+
+    # then
+    with pytest.raises(expected_error):
+        validate(value)
@@ -9,6 +9,12 @@ from opyapi.errors import (
 )
 from opyapi import build_validator_for
 
+ADDRESS_PROPERTIES = {
+    "number": {"type": "number"},
+    "street_name": {"type": "string"},
+    "street_type": {"enum": ["Street", "Avenue", "Boulevard"]},
+}
+
 
 def test_validate_object() -> None:
     # given
@@ -27,16 +33,7 @@ def test_validate_object() -> None:
 
 def test_validate_object_properties() -> None:
     # given
-    validate = build_validator_for(
-        {
-            "type": "object",
-            "properties": {
-                "number": {"type": "number"},
-                "street_name": {"type": "string"},
-                "street_type": {"enum": ["Street", "Avenue", "Boulevard"]},
-            },
-        }
-    )
+    validate = build_validator_for({"type": "object", "properties": ADDRESS_PROPERTIES})
 
     # then
     validate({})
@@ -65,17 +62,7 @@ def test_validate_object_pattern_properties() -> None:
 
 def test_validate_object_additional_properties() -> None:
     # given
-    validate = build_validator_for(
-        {
-            "type": "object",
-            "properties": {
-                "number": {"type": "number"},
-                "street_name": {"type": "string"},
-                "street_type": {"enum": ["Street", "Avenue", "Boulevard"]},
-            },
-            "additionalProperties": False,
-        }
-    )
+    validate = build_validator_for({"type": "object", "properties": ADDRESS_PROPERTIES, "additionalProperties": False})
 
     # then
     assert validate({"number": 1600, "street_name": "Pennsylvania", "street_type": "Avenue"})
@@ -86,15 +73,7 @@ def test_validate_object_additional_properties() -> None:
 def test_validate_object_additional_properties_with_validator() -> None:
     # given
     validate = build_validator_for(
-        {
-            "type": "object",
-            "properties": {
-                "number": {"type": "number"},
-                "street_name": {"type": "string"},
-                "street_type": {"enum": ["Street", "Avenue", "Boulevard"]},
-            },
-            "additionalProperties": {"type": "string"},
-        }
+        {"type": "object", "properties": ADDRESS_PROPERTIES, "additionalProperties": {"type": "string"}}
     )
 
     # then
@@ -219,3 +198,44 @@ def test_validate_property_names() -> None:
 
     # then
     assert validate({'foo': 1})
+    assert validate({1: "foo"})
+
+
+def test_validate_property_names_false() -> None:
+    # given
+    validate = build_validator_for({"type": "object", "propertyNames": False})
+
+    # then
+    assert validate({}) == {}
+    with pytest.raises(PropertyNameValidationError):
+        validate({"foo": 1})
+
+
+def test_validate_object_checks_required_properties_first() -> None:
+    # given
+    validate = build_validator_for(
+        {
+            "type": "object",
+            "properties": {"name": {"type": "string"}, "email": {"type": "string"}},
+            "required": ["email"],
+        }
+    )
+
+    # then
+    with pytest.raises(RequiredPropertyValidationError):
+        validate({"name": 42})
+
+
+def test_validate_open_object_returns_copy() -> None:
+    # given
+    validate = build_validator_for({"type": "object", "required": ["name"]})
+    value = {"name": "Bob", "age": 42}
+
+    # when
+    result = validate(value)
+
+    # then
+    assert result == value
+    assert result is not value
+    with pytest.raises(PropertyNameValidationError):
+        validate({"name": "Bob", 1: 42})
@@ -1,6 +1,9 @@
+import re
+
 import pytest
 
-from opyapi import StringFormat
+from opyapi import RegexFormat, StringFormat
+from opyapi.errors import FormatValidationError
 from opyapi.validators import validate_string_format
 
 
@@ -22,6 +25,35 @@ def test_can_define_new_format() -> None:
         validate_string_format("invalid", "my-format")
 
 
+def test_can_define_new_format_with_compiled_pattern() -> None:
+    StringFormat["my-prefixed-format"] = re.compile("^my-")
+
+    assert validate_string_format("my-value", "my-prefixed-format")
+
+    with pytest.raises(FormatValidationError):
+        validate_string_format("invalid", "my-prefixed-format")
+
+
+def test_can_define_new_regex_format() -> None:
+    StringFormat["postal-code"] = RegexFormat(r"^[0-9]{5}(-[0-9]{4})?$")
+
+    assert validate_string_format("20500", "postal-code")
+
+    with pytest.raises(FormatValidationError) as error:
+        validate_string_format("K1M 1M4", "postal-code")
+    assert error.value.context["expected_format"] == "postal-code"
+
+
+def test_can_replace_regex_format_with_callable() -> None:
+    StringFormat["replaced-format"] = RegexFormat("^a")
+    assert "replaced-format" in StringFormat.regex_formats
+
+    StringFormat["replaced-format"] = str.upper
+
+    assert "replaced-format" not in StringFormat.regex_formats
+    assert validate_string_format("b", "replaced-format") == "B"
+
+
 def test_can_use_predefined_format() -> None:
     assert validate_string_format("email@test.com", "email")
 
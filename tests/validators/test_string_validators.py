@@ -1,4 +1,8 @@
+import re
+from types import SimpleNamespace
+
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from opyapi import build_validator_for
 from opyapi.errors import (
@@ -12,6 +16,8 @@ from opyapi.validators import (
     validate_minimum_length,
     validate_string_pattern,
 )
+from opyapi.validators import _regex
+from opyapi.validators._regex import compile_pattern, use_re2
 
 
 @pytest.mark.parametrize("value, pattern", [["test", "^t[a-z]+"], ["123", "[0-3]+"], ["a23bcd", "[a-d2-3]+"]])
@@ -31,6 +37,47 @@ def test_fail_validate_string_pattern(value: str, pattern: str) -> None:
         validate_string_pattern(value, pattern)
 
 
+def test_string_patterns_are_compiled_once() -> None:
+    # given
+    compile_pattern.cache_clear()
+
+    # when
+    validate_string_pattern("test", "^t[a-z]+")
+    validate_string_pattern("toast", "^t[a-z]+")
+
+    # then
+    assert compile_pattern.cache_info().misses == 1
+    assert compile_pattern.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("value, pattern", [["١٢٣", "^\\d+$"], ["ünïcode", "^\\w+$"], ["end\n", "^end$"]])
+def test_patterns_use_python_semantics_by_default(value: str, pattern: str) -> None:
+    assert validate_string_pattern(value, pattern)
+
+
+def test_can_match_patterns_with_re2(monkeypatch: MonkeyPatch) -> None:
+    # given
+    monkeypatch.setattr(_regex, "_use_re2", False)
+    monkeypatch.setattr(_regex, "re2", SimpleNamespace(compile=lambda pattern: ("re2", pattern), error=re.error))
+
+    # when
+    use_re2()
+
+    # then
+    assert compile_pattern("^[a-z]+$") == ("re2", "^[a-z]+$")
+    use_re2(False)
+    assert compile_pattern("^[a-z]+$") == re.compile("^[a-z]+$")
+
+
+def test_fail_use_re2_without_google_re2(monkeypatch: MonkeyPatch) -> None:
+    # given
+    monkeypatch.setattr(_regex, "re2", None)
+
+    # then
+    with pytest.raises(ImportError):
+        use_re2()
+
+
 @pytest.mark.parametrize("value, expected_minimum", [["test", 1], ["123", 3], ["a23bcd", 0]])
 def test_pass_validate_minimum_length(value: str, expected_minimum: int) -> None:
     assert validate_minimum_length(value, expected_minimum)
@@ -99,3 +99,24 @@ def test_can_specify_multiple_types() -> None:
     # then
     with pytest.raises(ValueError):
         validate(1.1)
+
+
+@pytest.mark.parametrize(
+    "value, expected_values, valid",
+    [
+        [1, [1, 2, 3], True],
+        [1.0, [1, 2, 3], True],
+        [True, [1, 2, 3], False],
+        [0, [False, "0"], False],
+        [False, [False, "0"], True],
+        [[1], [1, 2, 3], False],
+        [[1], [[1], 2], True],
+    ],
+)
+def test_validate_enum_members(value: Any, expected_values: list, valid: bool) -> None:
+    validator = build_validator_for({"enum": expected_values})
+    if valid:
+        assert validator(value) == value
+    else:
+        with pytest.raises(EnumValidationError):
+            validator(value)